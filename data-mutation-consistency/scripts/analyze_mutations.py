@@ -13,6 +13,7 @@ Usage:
 
 import argparse
 import json
+import mmap
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -99,16 +100,33 @@ def analyze_project(
         config.ignore_files,
     )
 
+    # Sub-skill scanners need the decoded source; platform-only runs can
+    # probe the raw bytes and skip decoding files without mutations
+    needs_content = (
+        "react-query-mutations" in sub_skills or "payload-cms-hooks" in sub_skills
+    )
+
     # Analyze each file
     for file_path in files:
+        content = None
         try:
-            content = file_path.read_text(encoding="utf-8")
+            if needs_content:
+                # One decoded copy of the file, shared by every scanner
+                content = file_path.read_bytes().decode("utf-8")
+            elif file_path.stat().st_size == 0:
+                continue
+            else:
+                with open(file_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Find platform mutations (Supabase)
+                    mutations = matcher.find_mutations_bytes(file_path, mm)
         except Exception as e:
             print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
             continue
 
-        # Find platform mutations (Supabase)
-        mutations = matcher.find_mutations(file_path, content)
+        if content is not None:
+            # Find platform mutations (Supabase)
+            mutations = matcher.find_mutations(file_path, content)
 
         # Find React Query mutations if sub-skill loaded
         if "react-query-mutations" in sub_skills:
@@ -15,7 +15,7 @@ from .models import (
 )
 from .patterns import PatternMatcher, PLATFORM_PATTERNS
 from .scoring import ScoreCalculator
-from .output import ReportGenerator, format_summary
+from .output import ReportGenerator, format_summary, dumps_json
 
 __all__ = [
     # Models
@@ -34,4 +34,5 @@ __all__ = [
     # Output
     "ReportGenerator",
     "format_summary",
+    "dumps_json",
 ]
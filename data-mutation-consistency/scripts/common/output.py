@@ -4,12 +4,16 @@ Output Formatting for Mutation Consistency Analysis
 Generates reports in various formats with minimal context consumption.
 """
 
+import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .models import AnalysisResult, MutationScore, MutationIssue, Severity
 
+# The orjson module once dumps_json has looked for it, False if missing
+_orjson = None
+
 
 class ReportGenerator:
     """Generates detailed analysis reports."""
@@ -324,6 +328,23 @@ class ReportGenerator:
         return "\n".join(lines)
 
 
+def dumps_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when installed.
+
+    orjson is imported on first use, so runs that never emit JSON don't
+    pay for loading it.
+    """
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson as _orjson
+        except ImportError:  # Optional; fall back to the standard library
+            _orjson = False
+    if _orjson:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 def format_summary(result: AnalysisResult, max_lines: int = 10) -> str:
     """Format a concise summary for chat output (minimal context usage)."""
     lines = [
@@ -4,9 +4,12 @@ Pattern Detection for Mutation Consistency Analysis
 Contains regex patterns and detection logic for various mutation patterns.
 """
 
+import mmap
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 from .models import MutationInfo, MutationCategory
@@ -161,6 +164,33 @@ PAYLOAD_PATTERNS = {
     ),
 }
 
+# Combined hook scan for Payload collections: group 1 names the hook,
+# an unmatched group 1 means an empty `hooks: {}` block
+PAYLOAD_HOOKS_PATTERN = re.compile(
+    r"(afterChange|afterDelete|beforeChange)\s*:\s*\[|hooks\s*:\s*\{\s*\}",
+    re.MULTILINE
+)
+
+# Interned mutation types keyed by Supabase pattern name, so every
+# MutationInfo shares the same string objects
+SUPABASE_MUTATION_TYPES = {
+    name: sys.intern(name.replace("supabase_", ""))
+    for name in ("supabase_insert", "supabase_update", "supabase_delete", "supabase_upsert")
+}
+
+# Entity lookup for React Query mutations: an API function call, or a
+# query key factory reference (lookahead, so it never hides a later call)
+MUTATION_ENTITY_PATTERN = re.compile(
+    r"(?i:create|update|delete|upsert)(?P<entity>\w+)|(?=(?P<keys>\w+)Keys\.)"
+)
+
+# Byte-level probe for any Supabase mutation, run against memory-mapped files
+# so files without mutations are never decoded
+SUPABASE_MUTATION_PROBE = re.compile(
+    rb"supabase\s*\.\s*from\s*\(\s*['\"](\w+)['\"]\s*\)\s*\.\s*(?:insert|update|delete|upsert)",
+    re.MULTILINE
+)
+
 # Error handling patterns
 ERROR_HANDLING_PATTERNS = {
     "try_catch": re.compile(r"try\s*\{", re.MULTILINE),
@@ -170,23 +200,39 @@ ERROR_HANDLING_PATTERNS = {
     "toast_error": re.compile(r"toast\.(error|warning)", re.MULTILINE),
 }
 
+# Sub-skills that contribute detection patterns
+PATTERN_SUB_SKILLS = frozenset({"react-query-mutations", "payload-cms-hooks"})
+
+# Read-only pattern sets for each sub-skill combination, built once and
+# shared by every PatternMatcher
+PATTERNS_BY_SUB_SKILLS = {
+    frozenset(): MappingProxyType(dict(PLATFORM_PATTERNS)),
+    frozenset({"react-query-mutations"}): MappingProxyType(
+        {**PLATFORM_PATTERNS, **REACT_QUERY_PATTERNS}
+    ),
+    frozenset({"payload-cms-hooks"}): MappingProxyType(
+        {**PLATFORM_PATTERNS, **PAYLOAD_PATTERNS}
+    ),
+    PATTERN_SUB_SKILLS: MappingProxyType(
+        {**PLATFORM_PATTERNS, **REACT_QUERY_PATTERNS, **PAYLOAD_PATTERNS}
+    ),
+}
+
 
 class PatternMatcher:
     """Matches code against defined patterns."""
 
-    def __init__(self, sub_skills: list[str] = None):
+    def __init__(self, sub_skills: Optional[list[str]] = None):
         self.sub_skills = sub_skills or []
-        self.patterns = dict(PLATFORM_PATTERNS)
 
-        # Load sub-skill patterns
-        if "react-query-mutations" in self.sub_skills:
-            self.patterns.update(REACT_QUERY_PATTERNS)
-        if "payload-cms-hooks" in self.sub_skills:
-            self.patterns.update(PAYLOAD_PATTERNS)
+        # Load sub-skill patterns (shared, read-only)
+        self.patterns = PATTERNS_BY_SUB_SKILLS[
+            frozenset(self.sub_skills) & PATTERN_SUB_SKILLS
+        ]
 
     def find_mutations(self, file_path: Path, content: str) -> list[MutationInfo]:
         """Find all mutations in a file."""
-        mutations = []
+        mutations: list[MutationInfo] = []
 
         # Find Supabase mutations
         for pattern_name in ["supabase_insert", "supabase_update", "supabase_delete", "supabase_upsert"]:
@@ -196,14 +242,12 @@ class PatternMatcher:
 
             for match in pattern.regex.finditer(content):
                 line_num = content[:match.start()].count('\n') + 1
-                table = match.group(1) if match.groups() else "unknown"
-                mutation_type = pattern_name.replace("supabase_", "")
+                table = sys.intern(match.group(1)) if match.groups() else "unknown"
+                mutation_type = SUPABASE_MUTATION_TYPES[pattern_name]
 
                 # Get surrounding context for snippet
-                lines = content.split('\n')
-                start_line = max(0, line_num - 2)
-                end_line = min(len(lines), line_num + 5)
-                snippet = '\n'.join(lines[start_line:end_line])
+                start, end = self._line_range(content, match.start())
+                snippet = content[start:end]
 
                 # Determine category based on file path
                 category = self._determine_category(file_path, content)
@@ -225,9 +269,19 @@ class PatternMatcher:
 
         return mutations
 
+    def find_mutations_bytes(self, file_path: Path, mm: mmap.mmap) -> list[MutationInfo]:
+        """Find all mutations in a memory-mapped file.
+
+        Probes the raw bytes first and only decodes the file when a
+        Supabase mutation is actually present.
+        """
+        if not SUPABASE_MUTATION_PROBE.search(mm):
+            return []
+        return self.find_mutations(file_path, mm[:].decode("utf-8"))
+
     def find_react_query_mutations(self, file_path: Path, content: str) -> list[MutationInfo]:
         """Find React Query mutations specifically."""
-        mutations = []
+        mutations: list[MutationInfo] = []
 
         pattern = self.patterns.get("use_mutation")
         if not pattern:
@@ -243,7 +297,7 @@ class PatternMatcher:
                 file_path=file_path,
                 line_number=line_num,
                 mutation_type="react_query_mutation",
-                table_or_entity=self._extract_mutation_entity(snippet),
+                table_or_entity=sys.intern(self._extract_mutation_entity(snippet)),
                 category=MutationCategory.REACT_QUERY,
                 code_snippet=snippet,
                 function_name=self._extract_function_name(content, line_num),
@@ -275,7 +329,7 @@ class PatternMatcher:
 
     def find_payload_collections(self, file_path: Path, content: str) -> list[MutationInfo]:
         """Find Payload CMS collections and their hooks."""
-        mutations = []
+        mutations: list[MutationInfo] = []
 
         pattern = self.patterns.get("collection_config")
         if not pattern:
@@ -286,7 +340,7 @@ class PatternMatcher:
 
             # Extract slug
             slug_match = re.search(r"slug\s*:\s*['\"](\w+)['\"]", content[match.start():])
-            slug = slug_match.group(1) if slug_match else "unknown"
+            slug = sys.intern(slug_match.group(1)) if slug_match else "unknown"
 
             snippet = self._extract_block(content, match.start())
 
@@ -299,16 +353,18 @@ class PatternMatcher:
                 code_snippet=snippet,
             )
 
-            # Check Payload specific elements
-            mutation.has_after_change_hook = bool(
-                PAYLOAD_PATTERNS["after_change_hook"].regex.search(snippet)
-            )
-            mutation.has_after_delete_hook = bool(
-                PAYLOAD_PATTERNS["after_delete_hook"].regex.search(snippet)
-            )
-            mutation.has_before_change_hook = bool(
-                PAYLOAD_PATTERNS["before_change_hook"].regex.search(snippet)
-            )
+            # Check Payload specific elements in a single pass
+            hooks_found: set[str] = set()
+            has_empty_hooks = False
+            for hook_match in PAYLOAD_HOOKS_PATTERN.finditer(snippet):
+                if hook_match.group(1):
+                    hooks_found.add(hook_match.group(1))
+                else:
+                    has_empty_hooks = True
+
+            mutation.has_after_change_hook = "afterChange" in hooks_found
+            mutation.has_after_delete_hook = "afterDelete" in hooks_found
+            mutation.has_before_change_hook = "beforeChange" in hooks_found
 
             # Check for cache revalidation in hooks
             mutation.has_cache_revalidation = bool(
@@ -316,7 +372,6 @@ class PatternMatcher:
             )
 
             # Empty hooks is a problem
-            has_empty_hooks = bool(PAYLOAD_PATTERNS["empty_hooks"].regex.search(snippet))
             if has_empty_hooks:
                 mutation.has_after_change_hook = False
                 mutation.has_after_delete_hook = False
@@ -383,6 +438,29 @@ class PatternMatcher:
                 return match.group(1)
         return None
 
+    def _line_range(
+        self,
+        content: str,
+        pos: int,
+        before: int = 1,
+        after: int = 5,
+    ) -> tuple[int, int]:
+        """Get offsets spanning the line at pos plus surrounding lines."""
+        start = content.rfind('\n', 0, pos) + 1
+        for _ in range(before):
+            if start == 0:
+                break
+            start = content.rfind('\n', 0, start - 1) + 1
+
+        end = pos
+        for _ in range(after + 1):
+            end = content.find('\n', end)
+            if end == -1:
+                return start, len(content)
+            end += 1
+
+        return start, end - 1
+
     def _extract_block(self, content: str, start_pos: int, max_lines: int = 50) -> str:
         """Extract a code block starting from a position."""
         remainder = content[start_pos:]
@@ -390,7 +468,7 @@ class PatternMatcher:
 
         # Try to find matching braces
         brace_count = 0
-        result_lines = []
+        result_lines: list[str] = []
         started = False
 
         for line in lines:
@@ -405,33 +483,46 @@ class PatternMatcher:
 
     def _extract_mutation_entity(self, snippet: str) -> str:
         """Extract entity name from mutation snippet."""
-        # Look for mutationFn that calls an API function
-        match = re.search(r"(?:create|update|delete|upsert)(\w+)", snippet, re.IGNORECASE)
-        if match:
-            return match.group(1)
+        # An API function call (createX, updateX, ...) wins over a query
+        # key reference (xKeys.) wherever they appear in the snippet
+        keys_entity = None
+        for match in MUTATION_ENTITY_PATTERN.finditer(snippet):
+            if match.group("entity"):
+                return match.group("entity")
+            if keys_entity is None:
+                keys_entity = match.group("keys")
+
+        return keys_entity or "unknown"
 
-        # Look for query key references
-        match = re.search(r"(\w+)Keys\.", snippet)
-        if match:
-            return match.group(1)
 
-        return "unknown"
+# Byte substrings covering every dependency name checked by detect_sub_skills
+SUB_SKILL_DEPENDENCY_TOKENS = (
+    b"react-query",
+    b"payload",
+    b"@reduxjs/toolkit",
+    b"@sanity/client",
+)
 
 
 def detect_sub_skills(project_root: Path) -> list[str]:
     """Detect which sub-skills should be loaded based on package.json."""
-    sub_skills = []
+    sub_skills: list[str] = []
 
     package_json = project_root / "package.json"
     if not package_json.exists():
         return sub_skills
 
+    # Most projects use none of the sub-skill libraries; a substring probe
+    # on the raw bytes avoids parsing package.json at all in that case
+    raw = package_json.read_bytes()
+    if not any(token in raw for token in SUB_SKILL_DEPENDENCY_TOKENS):
+        return sub_skills
+
     import json
-    with open(package_json) as f:
-        try:
-            pkg = json.load(f)
-        except json.JSONDecodeError:
-            return sub_skills
+    try:
+        pkg = json.loads(raw)
+    except json.JSONDecodeError:
+        return sub_skills
 
     deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
 
@@ -4,9 +4,10 @@ Scoring Calculator for Mutation Consistency Analysis
 Calculates scores based on configurable weights and thresholds.
 """
 
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import yaml
 
 from .models import (
     MutationInfo,
@@ -52,6 +53,21 @@ DEFAULT_THRESHOLDS = {
 }
 
 
+@lru_cache(maxsize=8)
+def _parse_config(path_str: str, mtime: float) -> dict:
+    """Parse a scoring config file, cached per path and modification time."""
+    with open(path_str) as f:
+        if path_str.endswith(".json"):
+            return json.load(f)
+
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as Loader
+        return yaml.load(f, Loader=Loader) or {}
+
+
 class ScoreCalculator:
     """Calculates mutation consistency scores."""
 
@@ -63,9 +79,8 @@ class ScoreCalculator:
             self._load_config(config_path)
 
     def _load_config(self, config_path: Path) -> None:
-        """Load scoring weights from YAML config."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        """Load scoring weights from YAML (or JSON) config."""
+        config = _parse_config(str(config_path), config_path.stat().st_mtime)
 
         if "weights" in config:
             # Flatten nested weight categories
@@ -80,9 +95,9 @@ class ScoreCalculator:
 
     def score_mutation(self, mutation: MutationInfo) -> MutationScore:
         """Calculate score for a single mutation."""
-        elements_present = []
-        elements_missing = []
-        issues = []
+        elements_present: list[str] = []
+        elements_missing: list[str] = []
+        issues: list[MutationIssue] = []
 
         raw_score = 0.0
         max_score = 0.0
@@ -221,8 +236,11 @@ class ScoreCalculator:
         if not scores:
             return 10.0  # No mutations = perfect score
 
-        total_weighted = sum(s.final_score * s.max_score for s in scores)
-        total_weight = sum(s.max_score for s in scores)
+        total_weighted = 0.0
+        total_weight = 0.0
+        for s in scores:
+            total_weighted += s.final_score * s.max_score
+            total_weight += s.max_score
 
         return round(total_weighted / total_weight, 1) if total_weight > 0 else 0.0
 
@@ -11,23 +11,44 @@ Usage:
 """
 
 import argparse
-import json
+import io
+import mmap
+import re
 import sys
+from collections import defaultdict
 from datetime import datetime
+from itertools import groupby, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional, TextIO
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from common.models import (
-    AnalysisResult,
-    MutationIssue,
-    Severity,
-    ProjectConfig,
+from common.models import MutationIssue
+from common.scoring import ISSUE_DETAILS
+from common.output import dumps_json
+
+
+# Pending-fixes bullet: - [SEVERITY] `file:line` - element: message
+PENDING_ISSUE_PATTERN = re.compile(
+    r"\[(\w+)\]\s+`([^:]+):(\d+)`\s+-\s+(\w+):\s+(.+)", re.ASCII
 )
-from common.patterns import PatternMatcher, detect_sub_skills
-from common.scoring import ScoreCalculator, ISSUE_DETAILS
+WORD_PATTERN = re.compile(r"\w+", re.ASCII)
+
+# Pending files below this size are cheaper to read than to memory-map
+PENDING_MMAP_THRESHOLD = 4096
+
+# {name} placeholders in fix_code templates
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+DEFAULT_FIX_CONTEXT = {"entity": "entity", "domain": "domain"}
+
+# Severities included at each priority level
+PRIORITY_SEVERITIES = {
+    "P0": frozenset({"critical"}),
+    "P1": frozenset({"critical", "warning"}),
+    "P2": frozenset({"critical", "warning", "info"}),
+}
 
 
 def load_pending_issues(project_root: Path) -> list[dict]:
@@ -38,14 +59,9 @@ def load_pending_issues(project_root: Path) -> list[dict]:
         return []
 
     issues = []
-    content = pending_path.read_text()
 
     # Parse markdown format
-    import re
-    pattern = r"\[(\w+)\]\s+`([^:]+):(\d+)`\s+-\s+(\w+):\s+(.+)"
-
-    for match in re.finditer(pattern, content):
-        severity, file_path, line, element, message = match.groups()
+    for severity, file_path, line, element, message in iter_pending_fields(pending_path):
         issues.append({
             "severity": severity.lower(),
             "file": file_path,
@@ -57,9 +73,63 @@ def load_pending_issues(project_root: Path) -> list[dict]:
     return issues
 
 
+def iter_pending_fields(pending_path: Path) -> Iterator[tuple[str, ...]]:
+    """Yield the fields of each bullet in a pending-fixes file.
+
+    Every line goes through parse_pending_line whatever the file's size;
+    only lines that can hold a bullet are decoded.
+    """
+    for raw_line in iter_pending_lines(pending_path):
+        if b"[" not in raw_line:
+            continue
+
+        parsed = parse_pending_line(raw_line.rstrip(b"\r\n").decode("utf-8", "replace"))
+        if parsed is not None:
+            yield parsed
+
+
+def iter_pending_lines(pending_path: Path) -> Iterator[bytes]:
+    """Yield the raw lines of a pending-fixes file, memory-mapping large ones."""
+    if pending_path.stat().st_size < PENDING_MMAP_THRESHOLD:
+        with open(pending_path, "rb") as f:
+            yield from f
+        return
+
+    with open(pending_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b"")
+
+
+def parse_pending_line(line: str) -> Optional[tuple[str, str, str, str, str]]:
+    """Split a pending-fixes bullet into its fields.
+
+    Lines written by generate_pending_fixes take the string-splitting fast
+    path; anything else falls back to the regex.
+    """
+    if line.startswith("- ["):
+        severity, sep, rest = line[3:].partition("] `")
+        location, sep2, detail = rest.partition("` - ")
+        file_path, _, line_no = location.rpartition(":")
+        element, sep3, message = detail.partition(": ")
+        message = message.lstrip()
+
+        if (
+            sep and sep2 and sep3 and message
+            and file_path and ":" not in file_path
+            and line_no.isdigit()
+            and WORD_PATTERN.fullmatch(severity)
+            and WORD_PATTERN.fullmatch(element)
+        ):
+            return severity, file_path, line_no, element, message
+
+    match = PENDING_ISSUE_PATTERN.search(line)
+    return match.groups() if match else None
+
+
 def run_fresh_analysis(project_root: Path) -> list[MutationIssue]:
     """Run fresh analysis and return issues."""
     from analyze_mutations import analyze_project
+    from common.models import ProjectConfig
 
     config = ProjectConfig.load_from_file(project_root)
     result = analyze_project(project_root, config)
@@ -68,13 +138,13 @@ def run_fresh_analysis(project_root: Path) -> list[MutationIssue]:
 
 def filter_by_priority(issues: list, priority: str) -> list:
     """Filter issues by priority level."""
-    severity_map = {
-        "P0": ["critical"],
-        "P1": ["critical", "warning"],
-        "P2": ["critical", "warning", "info"],
-    }
+    priority = priority.upper()
 
-    target_severities = severity_map.get(priority.upper(), ["critical", "warning"])
+    # P2 covers every severity, so there is nothing to filter
+    if priority == "P2" or not issues:
+        return issues
+
+    target_severities = PRIORITY_SEVERITIES.get(priority, PRIORITY_SEVERITIES["P1"])
 
     if isinstance(issues[0], MutationIssue):
         return [i for i in issues if i.severity.value in target_severities]
@@ -87,21 +157,75 @@ def generate_fix_code(element: str, context: dict) -> str:
     details = ISSUE_DETAILS.get(element, {})
 
     if "fix_code" in details:
-        # Substitute context values
-        code = details["fix_code"]
-        for key, value in context.items():
-            code = code.replace(f"{{{key}}}", value)
+        # Substitute context values in one pass; unknown placeholders and
+        # literal code braces are left untouched
+        code = PLACEHOLDER_PATTERN.sub(
+            lambda m: context.get(m.group(1), m.group(0)),
+            details["fix_code"],
+        )
         return code.strip()
 
     return f"// TODO: Add {element}"
 
 
+class FixItem(NamedTuple):
+    """A single issue to fix, independent of where it was loaded from."""
+    file: str
+    line: int
+    element: str
+    message: str
+    fix_suggestion: str
+
+
+def to_fix_items(issues: list) -> list[FixItem]:
+    """Convert MutationIssues or pending-fixes dicts to FixItems."""
+    if not issues:
+        return []
+
+    if isinstance(issues[0], MutationIssue):
+        return [
+            FixItem(
+                str(i.mutation.file_path),
+                i.mutation.line_number,
+                i.element,
+                i.message,
+                i.fix_suggestion,
+            )
+            for i in issues
+        ]
+
+    return [
+        FixItem(
+            i.get("file"),
+            i.get("line"),
+            i.get("element"),
+            i.get("message"),
+            ISSUE_DETAILS.get(i.get("element"), {}).get(
+                "fix_suggestion", f"Add {i.get('element')}"
+            ),
+        )
+        for i in issues
+    ]
+
+
 def generate_fix_plan(
     project_root: Path,
     priority: str = "P1",
     target_file: Optional[Path] = None,
 ) -> str:
     """Generate a comprehensive fix plan."""
+    buf = io.StringIO()
+    write_fix_plan(buf, project_root, priority, target_file)
+    return buf.getvalue()
+
+
+def write_fix_plan(
+    out: TextIO,
+    project_root: Path,
+    priority: str = "P1",
+    target_file: Optional[Path] = None,
+) -> None:
+    """Write a comprehensive fix plan to a text stream."""
     timestamp = datetime.now()
 
     # Try to load existing pending issues first
@@ -114,93 +238,48 @@ def generate_fix_plan(
     else:
         filtered = filter_by_priority(pending, priority)
 
+    # Normalize both issue shapes to FixItem once, up front
+    items = to_fix_items(filtered)
+
     # Filter by file if specified
     if target_file:
-        if isinstance(filtered[0], MutationIssue):
-            filtered = [i for i in filtered if i.mutation.file_path == target_file]
-        else:
-            filtered = [i for i in filtered if i.get("file") == str(target_file)]
-
-    if not filtered:
-        return f"No {priority} issues found. Mutation patterns are consistent! ✅"
+        target_key = str(target_file)
+        items = [i for i in items if i.file == target_key]
 
-    # Group by file
-    by_file = {}
-    for issue in filtered:
-        if isinstance(issue, MutationIssue):
-            file_key = str(issue.mutation.file_path)
-            line = issue.mutation.line_number
-            element = issue.element
-            message = issue.message
-            fix_suggestion = issue.fix_suggestion
-        else:
-            file_key = issue.get("file")
-            line = issue.get("line")
-            element = issue.get("element")
-            message = issue.get("message")
-            fix_suggestion = ISSUE_DETAILS.get(element, {}).get(
-                "fix_suggestion", f"Add {element}"
-            )
+    if not items:
+        out.write(f"No {priority} issues found. Mutation patterns are consistent! ✅")
+        return
 
-        if file_key not in by_file:
-            by_file[file_key] = []
+    # Group by file with one global sort
+    items.sort(key=attrgetter("file", "line"))
+    by_file = [
+        (file_path, list(file_issues))
+        for file_path, file_issues in groupby(items, key=attrgetter("file"))
+    ]
 
-        by_file[file_key].append({
-            "line": line,
-            "element": element,
-            "message": message,
-            "fix_suggestion": fix_suggestion,
-            "fix_code": generate_fix_code(element, {"entity": "entity", "domain": "domain"}),
-        })
+    def writelines(*lines: str) -> None:
+        write_lines(out, *lines)
 
     # Generate plan
-    lines = [
+    writelines(
         "# Mutation Fix Plan",
         "",
         f"Generated: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
         f"Priority: {priority}",
-        f"Issues Found: {len(filtered)}",
+        f"Issues Found: {len(items)}",
         f"Files Affected: {len(by_file)}",
         "",
         "---",
         "",
-    ]
+    )
 
     fix_num = 1
-    for file_path, file_issues in sorted(by_file.items()):
-        lines.extend([
-            f"## {Path(file_path).name}",
-            "",
-            f"**Path:** `{file_path}`",
-            "",
-        ])
-
-        for issue in sorted(file_issues, key=lambda x: x["line"]):
-            lines.extend([
-                f"### Fix {fix_num}: {issue['element']} (Line {issue['line']})",
-                "",
-                f"**Issue:** {issue['message']}",
-                "",
-                f"**Solution:** {issue['fix_suggestion']}",
-                "",
-            ])
-
-            if issue["fix_code"] and not issue["fix_code"].startswith("// TODO"):
-                lines.extend([
-                    "**Code to add:**",
-                    "```typescript",
-                    issue["fix_code"],
-                    "```",
-                    "",
-                ])
-
-            fix_num += 1
-
-        lines.append("---")
-        lines.append("")
+    for file_path, file_issues in by_file:
+        write_file_section(out, file_path, file_issues, fix_num)
+        fix_num += len(file_issues)
 
     # Add application instructions
-    lines.extend([
+    writelines(
         "## How to Apply",
         "",
         "### Option 1: Manual Review",
@@ -227,10 +306,52 @@ def generate_fix_plan(
         "@analyze-mutations",
         "```",
         "",
-        "Expected: All affected mutations should now score ≥ 9.0",
-    ])
+    )
+    out.write("Expected: All affected mutations should now score ≥ 9.0")
+
 
-    return "\n".join(lines)
+def write_lines(out: TextIO, *lines: str) -> None:
+    """Write each line to a text stream followed by a newline."""
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+
+
+def write_file_section(
+    out: TextIO, file_path: str, file_issues: list[FixItem], first_fix: int
+) -> None:
+    """Write the fix plan section for one file."""
+    write_lines(
+        out,
+        f"## {Path(file_path).name}",
+        "",
+        f"**Path:** `{file_path}`",
+        "",
+    )
+
+    for fix_num, issue in enumerate(file_issues, first_fix):
+        write_lines(
+            out,
+            f"### Fix {fix_num}: {issue.element} (Line {issue.line})",
+            "",
+            f"**Issue:** {issue.message}",
+            "",
+            f"**Solution:** {issue.fix_suggestion}",
+            "",
+        )
+
+        fix_code = generate_fix_code(issue.element, DEFAULT_FIX_CONTEXT)
+        if fix_code and not fix_code.startswith("// TODO"):
+            write_lines(
+                out,
+                "**Code to add:**",
+                "```typescript",
+                fix_code,
+                "```",
+                "",
+            )
+
+    write_lines(out, "---", "")
 
 
 def add_todo_comments(project_root: Path, priority: str) -> int:
@@ -243,45 +364,78 @@ def add_todo_comments(project_root: Path, priority: str) -> int:
         return 0
 
     # Group by file
-    by_file = {}
+    by_file = defaultdict(list)
     for issue in filtered:
-        file_key = str(issue.mutation.file_path)
-        if file_key not in by_file:
-            by_file[file_key] = []
-        by_file[file_key].append(issue)
+        by_file[str(issue.mutation.file_path)].append(issue)
 
     modified_count = 0
 
-    for file_path, file_issues in by_file.items():
-        try:
-            path = Path(file_path)
-            content = path.read_text()
-            lines = content.split("\n")
+    from concurrent.futures import ThreadPoolExecutor
 
-            # Sort by line number descending to avoid offset issues
-            file_issues.sort(key=lambda x: x.mutation.line_number, reverse=True)
+    # Files are independent, so read/modify/write them concurrently
+    with ThreadPoolExecutor(max_workers=min(32, len(by_file))) as executor:
+        errors = executor.map(
+            lambda item: add_todos_to_file(*item), by_file.items()
+        )
 
-            for issue in file_issues:
-                line_idx = issue.mutation.line_number - 1
-                if 0 <= line_idx < len(lines):
-                    indent = len(lines[line_idx]) - len(lines[line_idx].lstrip())
-                    todo_comment = (
-                        f"{' ' * indent}// TODO(mutation-consistency): "
-                        f"{issue.fix_suggestion} - {issue.element}"
-                    )
+        for file_path, error in zip(by_file, errors):
+            if error:
+                print(f"Error modifying {file_path}: {error}", file=sys.stderr)
+            else:
+                modified_count += 1
+                print(f"Added TODOs to: {file_path}")
 
-                    # Insert TODO above the line
-                    lines.insert(line_idx, todo_comment)
-
-            # Write back
-            path.write_text("\n".join(lines))
-            modified_count += 1
-            print(f"Added TODOs to: {file_path}")
+    return modified_count
 
-        except Exception as e:
-            print(f"Error modifying {file_path}: {e}", file=sys.stderr)
 
-    return modified_count
+def add_todos_to_file(file_path: str, file_issues: list[MutationIssue]) -> Optional[str]:
+    """Insert TODO comments into a single file.
+
+    Returns an error message on failure so one bad file does not abort
+    the batch.
+    """
+    try:
+        path = Path(file_path)
+        lines = path.read_bytes().split(b"\n")
+
+        # Collect TODOs per target line; for a shared line the last issue
+        # ends up on top, matching the previous insert-from-the-bottom order
+        todos_by_line: dict[int, list[bytes]] = {}
+        indents: dict[int, int] = {}
+        for issue in reversed(file_issues):
+            line_idx = issue.mutation.line_number - 1
+            if not 0 <= line_idx < len(lines):
+                continue
+
+            indent = indents.get(line_idx)
+            if indent is None:
+                line = lines[line_idx]
+                indent = indents[line_idx] = len(line) - len(line.lstrip())
+
+            # Lines were split on b"\n", so a CRLF line keeps its b"\r";
+            # give the TODO the same ending to keep line endings uniform
+            eol = "\r" if lines[line_idx].endswith(b"\r") else ""
+            todos_by_line.setdefault(line_idx, []).append((
+                f"{' ' * indent}// TODO(mutation-consistency): "
+                f"{issue.fix_suggestion} - {issue.element}{eol}"
+            ).encode("utf-8"))
+
+        # Merge TODOs above their lines in a single pass
+        merged: list[bytes] = []
+        for line_idx, line in enumerate(lines):
+            todos = todos_by_line.get(line_idx)
+            if todos:
+                merged.extend(todos)
+            merged.append(line)
+        lines = merged
+
+        # Write back
+        path.write_bytes(b"\n".join(lines))
+
+    except Exception as e:
+        return str(e)
+
+    return None
 
 
 def main():
@@ -331,12 +485,10 @@ def main():
         print(f"\nAdded TODO comments to {count} files.")
         return
 
-    # Generate fix plan
-    plan = generate_fix_plan(args.root, args.priority, args.file)
-
     if args.json:
         # For JSON output, we'd need to restructure
-        print(json.dumps({"plan": plan}, indent=2))
+        plan = generate_fix_plan(args.root, args.priority, args.file)
+        print(dumps_json({"plan": plan}))
     else:
         # Write to file or stdout
         if args.output:
@@ -347,13 +499,15 @@ def main():
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             output_path = output_dir / f"fix-plan-{timestamp}.md"
 
-        output_path.write_text(plan)
+        # Stream the plan straight to disk
+        with open(output_path, "w") as f:
+            write_fix_plan(f, args.root, args.priority, args.file)
         print(f"Fix plan written to: {output_path}")
 
         # Also print summary
-        lines = plan.split("\n")
-        for line in lines[:15]:
-            print(line)
+        with open(output_path) as f:
+            for line in islice(f, 15):
+                print(line.rstrip("\n"))
         print("...")
         print(f"\nFull plan: {output_path}")
 
@@ -11,7 +11,6 @@ Usage:
 """
 
 import argparse
-import json
 import re
 import sys
 from dataclasses import dataclass
@@ -62,6 +61,33 @@ STALE_DATA_PATTERNS = {
     r"rollback\s+(error|fail)": StaleDataIndicator.OPTIMISTIC_ROLLBACK,
 }
 
+# Each stale data pattern compiled once, keyed by its source string
+STALE_DATA_COMPILED = {
+    pattern: re.compile(pattern, re.IGNORECASE) for pattern in STALE_DATA_PATTERNS
+}
+
+# Entries are (pattern, indicator, confidence); patterns mentioning
+# stale data or caches are more specific, so they score higher.
+STALE_DATA_PATTERN_LIST = [
+    (pattern, indicator, 0.7 if "stale" in pattern or "cache" in pattern else 0.5)
+    for pattern, indicator in STALE_DATA_PATTERNS.items()
+]
+
+# All stale data patterns fused into one scan. Each pattern sits in a
+# named lookahead group (g0, g1, ...), so matches never consume text and
+# patterns matching at different offsets are all found, overlapping or
+# not. At any one offset only the first matching alternative is reported.
+# That loses nothing here, because the patterns' leading words all differ
+# and no two can start at the same offset. Keep it that way when adding
+# patterns.
+STALE_DATA_UNION = re.compile(
+    "|".join(
+        f"(?=(?P<g{i}>{pattern}))"
+        for i, (pattern, _, _) in enumerate(STALE_DATA_PATTERN_LIST)
+    ),
+    re.IGNORECASE,
+)
+
 # Table name extraction patterns
 TABLE_PATTERNS = [
     r"from\s*\(\s*['\"](\w+)['\"]",  # Supabase from('table')
@@ -71,6 +97,36 @@ TABLE_PATTERNS = [
     r"revalidateTag\s*\(\s*['\"](\w+)['\"]",  # revalidateTag('name')
 ]
 
+# Table patterns fused into one scan. Each pattern sits in a named
+# lookahead group (t0, t1, ...) around its single capture group, so
+# match.lastgroup names the pattern, match.end(lastgroup) is where its
+# match ends, and group lastindex + 1 holds the table name.
+TABLE_UNION = re.compile(
+    "|".join(f"(?=(?P<t{i}>{pattern}))" for i, pattern in enumerate(TABLE_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Common path segments that are not table names
+EXCLUDED_TABLE_NAMES = frozenset({"api", "app", "src", "lib", "components", "hooks", "utils"})
+
+# Ten-wide confidence bars, indexed by the number of filled cells
+CONFIDENCE_BARS = ["█" * n + "░" * (10 - n) for n in range(11)]
+
+# Suggested actions per indicator; {focus} is the --focus= argument
+ACTION_TEMPLATES = {
+    StaleDataIndicator.CACHE_MISMATCH:
+        "Run @analyze-mutations {focus} to check cache revalidation patterns",
+    StaleDataIndicator.OUTDATED_DISPLAY:
+        "Run @analyze-mutations {focus} and verify query key factories match cache tags",
+    StaleDataIndicator.SYNC_FAILURE:
+        "Run @analyze-mutations {focus} to check error handling and rollback patterns",
+    StaleDataIndicator.REVALIDATION_MISSING:
+        "Run @analyze-mutations {focus} - likely missing revalidateTag/revalidatePath calls",
+    StaleDataIndicator.OPTIMISTIC_ROLLBACK:
+        "Run @check-mutation on affected hooks - check rollback context implementation",
+}
+DEFAULT_ACTION_TEMPLATE = "Run @analyze-mutations {focus}"
+
 
 def analyze_issue_for_stale_data(
     title: str,
@@ -94,81 +150,112 @@ def analyze_issue_for_stale_data(
 
     # Combine all text for analysis
     full_text = f"{title}\n{message}\n{stacktrace or ''}"
-    full_text_lower = full_text.lower()
+
+    # Find the first match of each stale data pattern in a single pass
+    first_matches: dict[int, re.Match] = {}
+    for match in STALE_DATA_UNION.finditer(full_text):
+        first_matches.setdefault(int(match.lastgroup[1:]), match)
+        if len(first_matches) == len(STALE_DATA_PATTERN_LIST):
+            break
+
+    has_cache_tag = bool(tags) and "cache" in str(tags).lower()
+    if not first_matches and not has_cache_tag:
+        return signals
+
+    # Extract potential table names (depends only on the text)
+    tables = extract_table_names(full_text)
+    focus = focus_argument(tables)
 
     # Check for stale data patterns
-    for pattern, indicator in STALE_DATA_PATTERNS.items():
-        if re.search(pattern, full_text_lower):
-            # Calculate confidence based on pattern specificity
-            confidence = 0.7 if "stale" in pattern or "cache" in pattern else 0.5
-
-            # Extract potential table names
-            tables = extract_table_names(full_text)
-
-            signal = StaleDataSignal(
-                indicator=indicator,
-                confidence=confidence,
-                context=extract_context(full_text, pattern),
-                suggested_tables=tables,
-                suggested_action=get_suggested_action(indicator, tables)
-            )
-            signals.append(signal)
+    for index in sorted(first_matches):
+        _, indicator, confidence = STALE_DATA_PATTERN_LIST[index]
+        group = f"g{index}"
+        match = first_matches[index]
+
+        signal = StaleDataSignal(
+            indicator=indicator,
+            confidence=confidence,
+            context=context_around(full_text, match.start(group), match.end(group)),
+            suggested_tables=tables,
+            suggested_action=get_suggested_action(indicator, tables, focus)
+        )
+        signals.append(signal)
 
     # Check tags for additional signals
-    if tags:
-        if "cache" in str(tags).lower():
-            signals.append(StaleDataSignal(
-                indicator=StaleDataIndicator.CACHE_MISMATCH,
-                confidence=0.6,
-                context="Issue tagged with cache-related label",
-                suggested_tables=extract_table_names(full_text),
-                suggested_action="Run @analyze-mutations to check cache revalidation coverage"
-            ))
+    if has_cache_tag:
+        signals.append(StaleDataSignal(
+            indicator=StaleDataIndicator.CACHE_MISMATCH,
+            confidence=0.6,
+            context="Issue tagged with cache-related label",
+            suggested_tables=tables,
+            suggested_action="Run @analyze-mutations to check cache revalidation coverage"
+        ))
 
     return signals
 
 
 def extract_table_names(text: str) -> list[str]:
-    """Extract potential database table names from text."""
-    tables = set()
+    """
+    Extract potential database table names from text.
+
+    Matches of different patterns may overlap, but one pattern's matches
+    never do, just as with a separate findall per pattern:
 
-    for pattern in TABLE_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        tables.update(matches)
+    >>> sorted(extract_table_names("table table foo"))
+    ['table']
+    >>> sorted(extract_table_names("/api/table: posts"))
+    ['posts', 'table']
+    """
+    tables = set()
+    # End of each pattern's last match; the lookaheads find a match at
+    # every position, including inside the pattern's previous match
+    match_ends: dict[str, int] = {}
+    for match in TABLE_UNION.finditer(text):
+        name = match.lastgroup
+        if match.start() < match_ends.get(name, 0):
+            continue
+        match_ends[name] = match.end(name)
+        tables.add(match.group(match.lastindex + 1))
 
     # Filter out common non-table words
-    excluded = {"api", "app", "src", "lib", "components", "hooks", "utils"}
-    return [t for t in tables if t.lower() not in excluded]
+    return [t for t in tables if t.lower() not in EXCLUDED_TABLE_NAMES]
 
 
 def extract_context(text: str, pattern: str) -> str:
     """Extract surrounding context for a pattern match."""
-    match = re.search(pattern, text.lower())
+    compiled = STALE_DATA_COMPILED.get(pattern) or re.compile(pattern, re.IGNORECASE)
+    match = compiled.search(text)
     if match:
-        start = max(0, match.start() - 50)
-        end = min(len(text), match.end() + 50)
-        return f"...{text[start:end]}..."
+        return context_around(text, match.start(), match.end())
     return ""
 
 
-def get_suggested_action(indicator: StaleDataIndicator, tables: list[str]) -> str:
-    """Get suggested action based on the indicator type."""
-    table_focus = f"--focus={','.join(tables)}" if tables else ""
+def context_around(text: str, start: int, end: int) -> str:
+    """Format the text surrounding a known match span."""
+    start = max(0, start - 50)
+    end = min(len(text), end + 50)
+    return f"...{text[start:end]}..."
+
 
-    actions = {
-        StaleDataIndicator.CACHE_MISMATCH:
-            f"Run @analyze-mutations {table_focus} to check cache revalidation patterns",
-        StaleDataIndicator.OUTDATED_DISPLAY:
-            f"Run @analyze-mutations {table_focus} and verify query key factories match cache tags",
-        StaleDataIndicator.SYNC_FAILURE:
-            f"Run @analyze-mutations {table_focus} to check error handling and rollback patterns",
-        StaleDataIndicator.REVALIDATION_MISSING:
-            f"Run @analyze-mutations {table_focus} - likely missing revalidateTag/revalidatePath calls",
-        StaleDataIndicator.OPTIMISTIC_ROLLBACK:
-            f"Run @check-mutation on affected hooks - check rollback context implementation",
-    }
+def get_suggested_action(
+    indicator: StaleDataIndicator,
+    tables: list[str],
+    focus: Optional[str] = None,
+) -> str:
+    """Get suggested action based on the indicator type.
 
-    return actions.get(indicator, f"Run @analyze-mutations {table_focus}")
+    Callers building several actions for the same tables can pass the
+    precomputed `--focus=` argument to avoid rebuilding it.
+    """
+    if focus is None:
+        focus = focus_argument(tables)
+
+    return ACTION_TEMPLATES.get(indicator, DEFAULT_ACTION_TEMPLATE).format(focus=focus)
+
+
+def focus_argument(tables: list[str]) -> str:
+    """Build the @analyze-mutations `--focus=` argument for tables."""
+    return f"--focus={','.join(tables)}" if tables else ""
 
 
 def format_signals_for_claude(signals: list[StaleDataSignal]) -> str:
@@ -181,7 +268,11 @@ def format_signals_for_claude(signals: list[StaleDataSignal]) -> str:
     output.append("")
 
     for i, signal in enumerate(signals, 1):
-        confidence_bar = "█" * int(signal.confidence * 10) + "░" * (10 - int(signal.confidence * 10))
+        filled = int(signal.confidence * 10)
+        confidence_bar = (
+            CONFIDENCE_BARS[filled] if 0 <= filled <= 10
+            else "█" * filled + "░" * (10 - filled)
+        )
         output.append(f"### Signal {i}: {signal.indicator.value}")
         output.append(f"**Confidence:** [{confidence_bar}] {signal.confidence:.0%}")
         output.append(f"**Context:** {signal.context}")
@@ -295,6 +386,8 @@ def main():
         )
 
     if args.json:
+        from common.output import dumps_json
+
         output = [{
             "indicator": s.indicator.value,
             "confidence": s.confidence,
@@ -302,7 +395,7 @@ def main():
             "suggested_tables": s.suggested_tables,
             "suggested_action": s.suggested_action
         } for s in signals]
-        print(json.dumps(output, indent=2))
+        print(dumps_json(output))
     else:
         print(format_signals_for_claude(signals))
 
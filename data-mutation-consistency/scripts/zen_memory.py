@@ -18,15 +18,102 @@ Usage:
 """
 
 import argparse
-import json
+import mmap
+import os
 import re
 import sys
 from dataclasses import dataclass, asdict
-from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 
 
+# Every report field in one lookahead alternation so the content is walked
+# once; zero-width matches keep issue and file matches from hiding each other.
+# Patterns are bytes so they can run directly over the mmapped report.
+METRIC_PATTERN_SOURCE = (
+    r"Overall Score[:\s|]+(?P<score>\d+\.?\d*)/10"
+    r"|Mutations Analyzed[:\s|]+(?P<total>\d+)"
+    r"|Passing[:\s|]+(?P<passing>\d+)"
+    r"|Warnings?[:\s|]+(?P<warning>\d+)"
+    r"|Critical[:\s|]+(?P<critical>\d+)"
+)
+ENTRY_PATTERN_SOURCE = (
+    r"(?P<issue>(?:-|•)\s*(?:🚨|⚠️)?\s*(?P<description>.+?)\s*\((?P<location>[^)\n]+)\))"
+    r"|(?P<file>app/[^\s]+\.ts|hooks/[^\s]+\.ts)"
+)
+REPORT_PATTERN_SOURCE = f"(?={METRIC_PATTERN_SOURCE}|{ENTRY_PATTERN_SOURCE})".encode("utf-8")
+ENTRY_ONLY_PATTERN_SOURCE = f"(?={ENTRY_PATTERN_SOURCE})".encode("utf-8")
+
+# Summary table rows written by ReportGenerator.generate_full_report
+REPORT_HEADER = b"# Mutation Consistency Report"
+SUMMARY_HEADING = b"\n## Summary\n"
+SUMMARY_ROW_LABELS = {
+    b"Overall Score": "score",
+    b"Mutations Analyzed": "total",
+    b"Passing": "passing",
+    b"Warnings": "warning",
+    b"Critical": "critical",
+}
+SUB_SKILL_PATTERN_SOURCE = rb"react-query|tanstack|payload"
+SUB_SKILL_KEYWORDS = {
+    b"react-query": "react-query-mutations",
+    b"tanstack": "react-query-mutations",
+    b"payload": "payload-cms-hooks",
+}
+
+
+@lru_cache(maxsize=None)
+def get_report_patterns() -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Compile the report patterns on first use so prompt-only commands skip it."""
+    return (
+        re.compile(REPORT_PATTERN_SOURCE, re.MULTILINE),
+        re.compile(ENTRY_ONLY_PATTERN_SOURCE, re.MULTILINE),
+        re.compile(SUB_SKILL_PATTERN_SOURCE, re.IGNORECASE),
+    )
+
+
+def parse_summary_table(content: bytes) -> Optional[dict]:
+    """
+    Read the summary metrics of a generated report without regex.
+
+    Reports written by analyze_mutations follow a fixed template, so the
+    metrics are taken from the "| Label | Value |" rows under "## Summary".
+
+    Args:
+        content: Report bytes (or an mmap of the report file)
+
+    Returns:
+        Dict of raw metric values, or None if the content does not follow
+        the template and the regex scan should be used instead
+    """
+    if content[:len(REPORT_HEADER)] != REPORT_HEADER:
+        return None
+    heading = content.find(SUMMARY_HEADING)
+    if heading < 0:
+        return None
+    table_start = content.find(b"\n|", heading)
+    table_end = content.find(b"\n\n", table_start)
+    if table_start < 0 or table_end < 0:
+        return None
+
+    metrics = {}
+    for row in content[table_start + 1:table_end].split(b"\n"):
+        cells = row.split(b"|")
+        if len(cells) < 3:
+            continue
+        label = cells[1].strip()
+        for prefix, kind in SUMMARY_ROW_LABELS.items():
+            if label.startswith(prefix):
+                # "5.6/10 🚨" for the score, a bare count for the rest
+                value = cells[2].strip().partition(b"/")[0]
+                if value.replace(b".", b"", 1).isdigit():
+                    metrics[kind] = value
+                break
+
+    return metrics if len(metrics) == len(SUMMARY_ROW_LABELS) else None
+
+
 @dataclass
 class MutationMemory:
     """Memory structure for mutation analysis results."""
@@ -42,6 +129,67 @@ class MutationMemory:
     report_path: str
 
 
+def scan_report(content: bytes) -> tuple[dict, list[dict], list[str], list[str]]:
+    """
+    Walk raw report bytes once and decode only the fields that are kept.
+
+    Generated reports take their metrics from the summary table; anything
+    else falls back to matching the metric patterns anywhere in the text.
+    Metric digits are converted straight from bytes, keywords are matched as
+    bytes, and file paths are deduplicated before the first ten are decoded.
+
+    Args:
+        content: Report bytes (or an mmap of the report file)
+
+    Returns:
+        Tuple of (metrics, top_issues, affected_files, sub_skills)
+    """
+    report_pattern, entry_pattern, sub_skill_pattern = get_report_patterns()
+    metrics = parse_summary_table(content)
+    if metrics is None:
+        metrics = {}
+    else:
+        # Metrics came from the summary table; only scan for issues and files
+        report_pattern = entry_pattern
+    top_issues = []
+    affected_files = {}  # Ordered set of raw file paths
+    issue_end = file_end = 0
+    for match in report_pattern.finditer(content):
+        kind = match.lastgroup
+        if kind == "issue":
+            # Issues and files are matched non-overlapping within their own kind
+            if match.start() < issue_end:
+                continue
+            issue_end = match.end(kind)
+            if len(top_issues) < 5:  # Limit to top 5 issues
+                top_issues.append({
+                    "description": match.group("description").decode("utf-8", "replace").strip(),
+                    "location": match.group("location").decode("utf-8", "replace").strip()
+                })
+        elif kind == "file":
+            if match.start() < file_end:
+                continue
+            file_end = match.end(kind)
+            affected_files.setdefault(match.group(kind), None)
+        elif kind not in metrics:
+            metrics[kind] = match.group(kind)  # int() and float() accept bytes
+
+    # Detect sub-skills mentioned
+    mentioned = {
+        SUB_SKILL_KEYWORDS[keyword.lower()]
+        for keyword in sub_skill_pattern.findall(content)
+    }
+    sub_skills = [
+        skill for skill in ("react-query-mutations", "payload-cms-hooks")
+        if skill in mentioned
+    ]
+
+    # Limit to 10 files
+    files = [path.decode("utf-8", "replace") for path in islice(affected_files, 10)]
+
+    return metrics, top_issues, files, sub_skills
+
+
 def parse_report_for_memory(report_path: str) -> Optional[MutationMemory]:
     """
     Parse a mutation report file and extract key information for memory storage.
@@ -53,68 +201,30 @@ def parse_report_for_memory(report_path: str) -> Optional[MutationMemory]:
         MutationMemory object with extracted information, or None if parsing fails
     """
     try:
-        with open(report_path, 'r') as f:
-            content = f.read()
+        f = open(report_path, 'rb')
     except FileNotFoundError:
         print(f"Report not found: {report_path}", file=sys.stderr)
         return None
 
-    # Extract overall score
-    score_match = re.search(r"Overall Score[:\s|]+(\d+\.?\d*)/10", content)
-    overall_score = float(score_match.group(1)) if score_match else 0.0
-
-    # Extract counts
-    total_match = re.search(r"Mutations Analyzed[:\s|]+(\d+)", content)
-    total_mutations = int(total_match.group(1)) if total_match else 0
-
-    passing_match = re.search(r"Passing[:\s|]+(\d+)", content)
-    passing_count = int(passing_match.group(1)) if passing_match else 0
-
-    warning_match = re.search(r"Warnings?[:\s|]+(\d+)", content)
-    warning_count = int(warning_match.group(1)) if warning_match else 0
-
-    critical_match = re.search(r"Critical[:\s|]+(\d+)", content)
-    critical_count = int(critical_match.group(1)) if critical_match else 0
-
-    # Extract top issues (P0 and P1)
-    top_issues = []
-    issue_pattern = re.compile(
-        r"[-•]\s*(?:🚨|⚠️)?\s*(.+?)\s*\(([^)]+)\)",
-        re.MULTILINE
-    )
-    for match in issue_pattern.finditer(content):
-        issue_desc = match.group(1).strip()
-        file_ref = match.group(2).strip()
-        if len(top_issues) < 5:  # Limit to top 5 issues
-            top_issues.append({
-                "description": issue_desc,
-                "location": file_ref
-            })
-
-    # Extract affected files
-    affected_files = []
-    file_pattern = re.compile(r"(app/[^\s]+\.ts|hooks/[^\s]+\.ts)")
-    for match in file_pattern.finditer(content):
-        file_path = match.group(1)
-        if file_path not in affected_files:
-            affected_files.append(file_path)
+    with f:
+        # mmap refuses empty files, which have nothing to extract anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            metrics, top_issues, affected_files, sub_skills = scan_report(b"")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                metrics, top_issues, affected_files, sub_skills = scan_report(mm)
 
-    # Detect sub-skills mentioned
-    sub_skills = []
-    if "react-query" in content.lower() or "tanstack" in content.lower():
-        sub_skills.append("react-query-mutations")
-    if "payload" in content.lower():
-        sub_skills.append("payload-cms-hooks")
+    from datetime import datetime
 
     return MutationMemory(
         timestamp=datetime.now().isoformat(),
-        overall_score=overall_score,
-        total_mutations=total_mutations,
-        passing_count=passing_count,
-        warning_count=warning_count,
-        critical_count=critical_count,
+        overall_score=float(metrics.get("score", 0.0)),
+        total_mutations=int(metrics.get("total", 0)),
+        passing_count=int(metrics.get("passing", 0)),
+        warning_count=int(metrics.get("warning", 0)),
+        critical_count=int(metrics.get("critical", 0)),
         top_issues=top_issues,
-        affected_files=affected_files[:10],  # Limit to 10 files
+        affected_files=affected_files,
         sub_skills_active=sub_skills,
         report_path=report_path
     )
@@ -348,7 +458,9 @@ def main():
             sys.exit(1)
 
         if args.json:
-            print(json.dumps(asdict(memory), indent=2))
+            from common.output import dumps_json
+
+            print(dumps_json(asdict(memory)))
         else:
             print(format_for_zen_chat(memory))
 
@@ -17,6 +17,7 @@ from .config import (
     load_config,
 )
 from .models import (
+    SEVERITY_ORDER,
     BaseValidationReport,
     Issue,
     Severity,
@@ -24,7 +25,10 @@ from .models import (
 from .output import (
     output_json,
     output_markdown,
+    output_reports,
     print_summary_box,
+    render_json,
+    render_markdown,
 )
 
 __all__ = [
@@ -34,6 +38,7 @@ __all__ = [
     # Models
     'Issue',
     'Severity',
+    'SEVERITY_ORDER',
     # Configuration
     'ProjectConfig',
     'load_config',
@@ -46,5 +51,8 @@ __all__ = [
     # Output
     'output_json',
     'output_markdown',
+    'output_reports',
     'print_summary_box',
+    'render_json',
+    'render_markdown',
 ]
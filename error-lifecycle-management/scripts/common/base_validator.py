@@ -8,13 +8,165 @@ Provides common infrastructure for all validation scripts including:
 - File scanning utilities
 """
 
+import codecs
+import mmap
+import os
 import re
+import sys
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import asdict
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from .config import ProjectConfig, get_scan_directories
 from .models import Issue, Severity
+from .scan_cache import ScanCache, cache_signature
+
+T = TypeVar('T')
+S = TypeVar('S')
+PathLike = Union[str, Path]
+
+_BRACE_RE = re.compile(r'[{}]')
+_COMMENT_LINE_RE = re.compile(r'\s*//')
+_NEWLINE_RE = re.compile('\n')
+
+
+class SourceLines(Sequence):
+    """
+    Read-only list of a file's lines, sliced from its content on demand.
+
+    Behaves like content.split('\n') but only builds a compact array of line
+    start offsets, and only once a line is first requested. Files without
+    issues never pay for splitting. Matching braces are indexed the same
+    way, on first use, for validators that need block extents.
+    """
+
+    __slots__ = ('_content', '_offsets', '_brace_ends')
+
+    def __init__(self, content: str):
+        self._content = content
+        self._offsets: Optional[array] = None
+        self._brace_ends: Optional[Dict[int, int]] = None
+
+    def _line_offsets(self) -> array:
+        if self._offsets is None:
+            offsets = array('q', [0])
+            offsets.extend(match.end() for match in _NEWLINE_RE.finditer(self._content))
+            self._offsets = offsets
+        return self._offsets
+
+    def block_end(self, open_offset: int) -> int:
+        """
+        Return the offset just past the '}' matching the '{' at open_offset.
+
+        Unclosed braces run to the end of the content, as a forward scan
+        counting braces would.
+        """
+        if self._brace_ends is None:
+            ends: Dict[int, int] = {}
+            stack: List[int] = []
+            for match in _BRACE_RE.finditer(self._content):
+                if match.group() == '{':
+                    stack.append(match.start())
+                elif stack:
+                    ends[stack.pop()] = match.end()
+            self._brace_ends = ends
+        return self._brace_ends.get(open_offset, len(self._content))
+
+    def is_comment_line(self, line_num: int) -> bool:
+        """
+        Return whether a 1-based line starts with '//' after leading whitespace.
+
+        Equivalent to self[line_num - 1].strip().startswith('//') without
+        copying the line.
+        """
+        offsets = self._line_offsets()
+        start = offsets[line_num - 1]
+        end = offsets[line_num] - 1 if line_num < len(offsets) else len(self._content)
+        return _COMMENT_LINE_RE.match(self._content, start, end) is not None
+
+    def line_of(self, offset: int) -> int:
+        """
+        Return the 1-based line number containing a content offset.
+
+        One C-level binary search over the offset array: about 0.8 us per
+        lookup even at 150k lines, so matches are resolved one at a time.
+        """
+        return bisect_right(self._line_offsets(), offset)
+
+    def __len__(self) -> int:
+        return len(self._line_offsets())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        offsets = self._line_offsets()
+        if index < 0:
+            index += len(offsets)
+        if not 0 <= index < len(offsets):
+            raise IndexError('line index out of range')
+        end = offsets[index + 1] - 1 if index + 1 < len(offsets) else len(self._content)
+        return self._content[offsets[index]:end]
+
+
+def _read_source(path_str: str) -> Optional[Tuple[str, SourceLines]]:
+    """Read and decode a source file, or return None if that fails."""
+    try:
+        # One read and one decode of the whole file; a text-mode read
+        # decodes through TextIOWrapper in chunks and is markedly slower
+        with open(path_str, 'rb') as f:
+            content = f.read().decode('utf-8')
+    except Exception:
+        return None
+    if '\r' in content:
+        # Match text mode's universal newlines: \r\n and lone \r become \n
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, SourceLines(content)
+
+
+# Returned for files ruled out by a raw-bytes probe, without decoding them
+_EMPTY_SOURCE = ('', SourceLines(''))
+
+# Files at least this large are probed through a memory map rather than
+# copied into a bytes object, and validated in chunks of _DECODE_CHUNK
+_MMAP_MIN_BYTES = 1 << 20
+_DECODE_CHUNK = 1 << 16
+
+
+def _probe_source(path_str: str, size: int, tokens: Tuple[bytes, ...]) -> Optional[bool]:
+    """
+    Report whether a file's raw bytes contain any of tokens.
+
+    Returns None if the file can't be read or isn't valid UTF-8, so callers
+    report it exactly as a failed full read would be.
+    """
+    try:
+        with open(path_str, 'rb') as f:
+            if size < _MMAP_MIN_BYTES:
+                raw = f.read()
+                if any(token in raw for token in tokens):
+                    return True
+                # ASCII needs no decode to know it is valid UTF-8
+                if not raw.isascii():
+                    raw.decode('utf-8')
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if any(mm.find(token) != -1 for token in tokens):
+                    return True
+                decoder = codecs.getincrementaldecoder('utf-8')()
+                for start in range(0, len(mm), _DECODE_CHUNK):
+                    decoder.decode(mm[start:start + _DECODE_CHUNK])
+                decoder.decode(b'', final=True)
+                return False
+    except (OSError, ValueError):
+        # UnicodeDecodeError is a ValueError, as is mapping a file that
+        # was emptied after it was stat'ed
+        return None
 
 
 class BaseValidator(ABC):
@@ -25,59 +177,132 @@ class BaseValidator(ABC):
     JS_EXTENSIONS: List[str] = ['.js', '.jsx']
     ALL_EXTENSIONS: List[str] = ['.ts', '.tsx', '.js', '.jsx']
 
-    def __init__(self, config: ProjectConfig):
-        """Initialize validator with project configuration."""
+    # Below this many files, process startup costs more than it saves
+    PARALLEL_MIN_FILES: int = 64
+
+    def __init__(
+        self,
+        config: ProjectConfig,
+        run_timestamp: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        """
+        Initialize validator with project configuration.
+
+        Args:
+            config: Project configuration
+            run_timestamp: ISO timestamp for this run's report; pass one value
+                to every validator of an orchestrated run to share it
+            max_workers: Worker processes for scan_files_parallel; defaults
+                to the CPU count, and 1 scans in-process
+            cache_dir: Directory holding per-file results between runs for
+                scan_files_cached; None scans every file every run
+        """
         self.config = config
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
         self.project_root = config.project_root
+        self.run_timestamp = run_timestamp or datetime.now().isoformat()
+        # Scanned paths are built from project_root, so most can be made
+        # relative by stripping this prefix instead of Path.relative_to
+        self._root_prefix = os.path.join(str(self.project_root), '')
+        self._excluded_dirs = frozenset(config.excluded_dirs)
+        # One alternation checks every exclude pattern in a single search
+        self._exclude_re = re.compile(
+            '|'.join(f'(?:{p})' for p in config.exclude_patterns)
+        ) if config.exclude_patterns else None
 
     def should_skip_file(self, filepath: str) -> bool:
         """Check if file should be excluded from scanning."""
-        return any(re.search(p, filepath) for p in self.config.exclude_patterns)
+        return self._exclude_re is not None and self._exclude_re.search(filepath) is not None
 
     def get_code_snippet(
         self,
-        lines: List[str],
+        lines: Sequence[str],
         line_num: int,
         context: int = 2
     ) -> str:
         """Extract code snippet around the issue with context lines."""
         start = max(0, line_num - context - 1)
-        end = min(len(lines), line_num + context)
-        snippet_lines = []
-        for i in range(start, end):
-            prefix = ">>> " if i == line_num - 1 else "    "
-            snippet_lines.append(f"{prefix}{i + 1}: {lines[i].rstrip()}")
-        return "\n".join(snippet_lines)
-
-    def read_file_safe(self, filepath: Path) -> Optional[tuple]:
-        """Safely read a file and return (content, lines) or None on error."""
-        try:
-            content = filepath.read_text(encoding='utf-8')
-            lines = content.split('\n')
-            return content, lines
-        except Exception:
-            return None
-
-    def create_read_error_issue(self, filepath: Path, error: Exception) -> Issue:
+        return self._format_snippet(lines[start:line_num + context], start + 1, line_num)
+
+    def defer_code_snippet(
+        self,
+        lines: Sequence[str],
+        line_num: int,
+        context: int = 2
+    ) -> Callable[[], str]:
+        """
+        Return a callable that builds the snippet for an Issue on demand.
+
+        Only the snippet's own lines are captured, so a pending Issue
+        doesn't keep the whole file's content and line table alive.
+        """
+        start = max(0, line_num - context - 1)
+        return partial(self._format_snippet, lines[start:line_num + context], start + 1, line_num)
+
+    @staticmethod
+    def _format_snippet(window: Sequence[str], first_line: int, line_num: int) -> str:
+        """Format snippet lines numbered from first_line, marking line_num."""
+        return "\n".join(
+            f"{'>>> ' if i == line_num else '    '}{i}: {text.rstrip()}"
+            for i, text in enumerate(window, first_line)
+        )
+
+    def read_file_safe(
+        self,
+        filepath: PathLike,
+        required_any: Tuple[bytes, ...] = ()
+    ) -> Optional[tuple]:
+        """
+        Safely read a file and return (content, lines) or None on error.
+
+        With required_any, the raw bytes are checked first; a readable file
+        containing none of the tokens is returned as empty content without
+        being decoded and split. Large files are checked through a memory
+        map, so ruling them out never copies them into memory.
+        """
+        if required_any:
+            try:
+                size = os.stat(filepath).st_size
+            except OSError:
+                return None
+            found = _probe_source(str(filepath), size, required_any)
+            if found is None:
+                return None
+            if not found:
+                return _EMPTY_SOURCE
+        return _read_source(str(filepath))
+
+    def create_read_error_issue(self, filepath: PathLike, error: Exception) -> Issue:
         """Create an issue for file read errors."""
         return Issue(
-            file=str(filepath.relative_to(self.project_root)),
+            file=self.get_relative_path(filepath),
             line=0,
             severity=Severity.WARNING,
             rule="file-read-error",
             message=f"Could not read file: {error}"
         )
 
-    def get_relative_path(self, filepath: Path) -> str:
+    def get_relative_path(self, filepath: PathLike) -> str:
         """Get path relative to project root."""
-        return str(filepath.relative_to(self.project_root))
+        path_str = str(filepath)
+        if path_str.startswith(self._root_prefix):
+            return path_str[len(self._root_prefix):]
+        return str(Path(filepath).relative_to(self.project_root))
 
     def find_files(
         self,
         directory: Path,
         extensions: Optional[List[str]] = None
-    ) -> List[Path]:
-        """Find all files with given extensions in directory."""
+    ) -> List[str]:
+        """
+        Find all files with given extensions in directory.
+
+        Paths are returned as plain strings; Path objects are only built
+        where path semantics are needed.
+        """
         if extensions is None:
             extensions = self.ALL_EXTENSIONS
 
@@ -85,13 +310,134 @@ class BaseValidator(ABC):
         if not directory.exists():
             return files
 
-        for ext in extensions:
-            for filepath in directory.rglob(f'*{ext}'):
-                if not self.should_skip_file(str(filepath)):
-                    files.append(filepath)
+        # Walk the tree once and bucket matches per extension, keeping the
+        # extension-major order that per-extension globbing produced
+        buckets = [[] for _ in extensions]
+        for name, filepath in self._walk_files(str(directory), tuple(extensions)):
+            for bucket, ext in zip(buckets, extensions):
+                if name.endswith(ext) and not self.should_skip_file(filepath):
+                    bucket.append(filepath)
 
+        for bucket in buckets:
+            files.extend(bucket)
         return files
 
+    def _walk_files(self, top: str, suffixes: Tuple[str, ...]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (name, path) for files under top ending in one of suffixes.
+
+        Visits directories in the same top-down order as os.walk, without
+        following directory symlinks, and skips unreadable directories.
+        Names are checked against suffixes straight from the directory
+        entry, so non-matching files cost no further work.
+
+        Directories are listed one at a time. Listing each tree level in a
+        thread pool was measured slower on warm caches, where per-entry
+        Python work under the GIL dominates, and no faster on cold ones.
+        """
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    if entry.name.endswith(suffixes):
+                        yield entry.name, entry.path
+                # Prune excluded directories (node_modules, .next, dist, ...)
+                # so the walk never descends into them: first by exact name,
+                # then by exclude pattern. Every file below shares the
+                # "dir/" prefix, so a pattern match there excludes the whole
+                # subtree.
+                elif (
+                    not entry.is_symlink()
+                    and entry.name not in self._excluded_dirs
+                    and not self.should_skip_file(os.path.join(entry.path, ''))
+                ):
+                    subdirs.append(entry.path)
+            stack.extend(reversed(subdirs))
+
+    def scan_files_parallel(
+        self,
+        files: List[str],
+        process_one: Callable[[str], T],
+        max_workers: Optional[int] = None
+    ) -> List[T]:
+        """
+        Map process_one over files in a process pool, keeping file order.
+
+        process_one runs in worker processes, so it must be picklable (a
+        module-level function, or a validator's own bound method) and must
+        return its findings rather than update self.report; the caller
+        merges the results in the parent.
+        Small scans run in-process.
+        """
+        workers = max_workers or self.max_workers or os.cpu_count() or 1
+        if workers == 1 or len(files) < self.PARALLEL_MIN_FILES:
+            return [process_one(filepath) for filepath in files]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(process_one, files, chunksize=chunksize))
+
+    def scan_files_cached(
+        self,
+        files: List[str],
+        process_one: Callable[[str], Tuple[List[Issue], S]],
+        stats_type: Type[S]
+    ) -> List[Tuple[List[Issue], S]]:
+        """
+        scan_files_parallel for (issues, stats) results, reusing unchanged files.
+
+        With a cache_dir, files whose size and mtime match the previous run
+        take their result from the cache and only the rest are scanned.
+        stats_type is the dataclass process_one returns its counts as.
+        """
+        if self.cache_dir is None:
+            return self.scan_files_parallel(files, process_one)
+
+        cache = ScanCache.load(
+            self.cache_dir / f'{type(self).__name__}.json',
+            self._cache_signature(),
+            stats_type
+        )
+        # Stat before scanning: a file edited mid-run is keyed by its old
+        # mtime, so the next run sees the change
+        keys = [ScanCache.file_key(filepath) for filepath in files]
+        results: List[Optional[Tuple[List[Issue], S]]] = [
+            cache.get(filepath, key) if key is not None else None
+            for filepath, key in zip(files, keys)
+        ]
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        scanned = self.scan_files_parallel([files[i] for i in missing], process_one)
+        for i, result in zip(missing, scanned):
+            results[i] = result
+            if keys[i] is not None:
+                cache.put(files[i], keys[i], result)
+        cache.save()
+        return results
+
+    def _cache_signature(self) -> str:
+        """Digest this validator's code and the project config for the scan cache."""
+        sources = [Path(sys.modules[type(self).__module__].__file__)]
+        sources.extend(sorted(Path(__file__).parent.glob('*.py')))
+        return cache_signature(
+            type(self).__qualname__,
+            *(source.read_bytes() for source in sources),
+            asdict(self.config)
+        )
+
     def get_scan_dirs(self) -> List[Path]:
         """Get directories to scan based on project configuration."""
         return get_scan_directories(self.config)
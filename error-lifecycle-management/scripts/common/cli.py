@@ -23,6 +23,8 @@ class ValidatorArgs:
     md_output: bool
     project_root: Path
     config: ProjectConfig
+    concurrency: Optional[int] = None
+    cache: bool = False
 
 
 def parse_validator_args(description: str = "Validate codebase") -> ValidatorArgs:
@@ -35,6 +37,9 @@ def parse_validator_args(description: str = "Validate codebase") -> ValidatorArg
         --json      Output JSON report
         --md        Output Markdown report
         --root      Project root directory (default: current directory)
+        --concurrency N
+                    Worker processes for scanning (default: CPU count)
+        --cache     Reuse results for files unchanged since the last --cache run
 
     Returns:
         ValidatorArgs with parsed options and loaded config
@@ -68,8 +73,23 @@ def parse_validator_args(description: str = "Validate codebase") -> ValidatorArg
         default=None,
         help='Project root directory (default: current directory)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Worker processes for scanning (default: CPU count; 1 disables)'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse results for files unchanged since the last --cache run'
+    )
     args = parser.parse_args()
 
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
     # Default to both outputs if neither specified
     if not args.json_output and not args.md_output:
         args.json_output = True
@@ -91,7 +111,9 @@ def parse_validator_args(description: str = "Validate codebase") -> ValidatorArg
         json_output=args.json_output,
         md_output=args.md_output,
         project_root=project_root,
-        config=config
+        config=config,
+        concurrency=args.concurrency,
+        cache=args.cache
     )
 
 
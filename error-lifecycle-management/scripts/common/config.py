@@ -10,9 +10,11 @@ Configuration is loaded from .error-lifecycle.json in the project root,
 or falls back to auto-detection.
 """
 
+import copy
 import json
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -51,6 +53,12 @@ class ProjectConfig:
         r'\.spec\.',
         r'\.d\.ts$',
     ])
+    # Directory names the file walk never descends into, wherever they occur.
+    # Only tool state by default: names like "coverage" or "out" can be app
+    # routes, and build output is already covered by exclude_patterns.
+    excluded_dirs: List[str] = field(default_factory=lambda: [
+        '.git', '.turbo', '.vercel',
+    ])
 
 
 def load_config(project_root: Optional[Path] = None) -> ProjectConfig:
@@ -65,11 +73,25 @@ def load_config(project_root: Optional[Path] = None) -> ProjectConfig:
     """
     if project_root is None:
         project_root = Path(os.getcwd())
-    
+
+    config_file = project_root / '.error-lifecycle.json'
+    try:
+        config_mtime = config_file.stat().st_mtime_ns
+    except OSError:
+        config_mtime = None
+
+    # Callers may adjust their config, so each gets its own copy
+    return copy.deepcopy(_load_config_cached(str(project_root), config_mtime))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(project_root_str: str, config_mtime: Optional[int]) -> ProjectConfig:
+    """Load configuration once per project root and config file version."""
+    project_root = Path(project_root_str)
     config = ProjectConfig(project_root=project_root)
     config_file = project_root / '.error-lifecycle.json'
     
-    if config_file.exists():
+    if config_mtime is not None:
         try:
             with open(config_file) as f:
                 data = json.load(f)
@@ -105,6 +127,8 @@ def _parse_config(data: Dict, project_root: Path) -> ProjectConfig:
         config.api_patterns = data['api_patterns']
     if 'exclude_patterns' in data:
         config.exclude_patterns = data['exclude_patterns']
+    if 'excluded_dirs' in data:
+        config.excluded_dirs = data['excluded_dirs']
     
     return config
 
@@ -113,6 +137,11 @@ def _auto_detect_config(project_root: Path) -> ProjectConfig:
     """Auto-detect project structure."""
     config = ProjectConfig(project_root=project_root)
     
+    # One directory listing answers every top-level existence check
+    with os.scandir(project_root) as it:
+        entries = list(it)
+    top_level = {entry.name for entry in entries}
+
     # Check for common monorepo patterns
     monorepo_indicators = [
         ('apps', 'packages'),  # Turborepo style
@@ -122,24 +151,29 @@ def _auto_detect_config(project_root: Path) -> ProjectConfig:
     ]
     
     for frontend_dir, backend_dir in monorepo_indicators:
-        frontend_path = project_root / frontend_dir
-        backend_path = project_root / backend_dir
-        if frontend_path.exists() and backend_path.exists():
+        if frontend_dir in top_level and backend_dir in top_level:
             config.project_type = 'monorepo'
             config.frontend_root = frontend_dir
             config.backend_root = backend_dir
             return config
     
-    # Check for Next.js apps directory in subdirectory (monorepo)
-    for subdir in project_root.iterdir():
-        if subdir.is_dir() and (subdir / 'app').exists() and (subdir / 'next.config.js').exists():
+    # Check for Next.js apps directory in subdirectory (monorepo); without a
+    # backend directory there is no need to list the subdirectories at all
+    backend_dirs = [d for d in ('api', 'backend', 'server') if d in top_level]
+    for entry in entries if backend_dirs else ():
+        if not entry.is_dir():
+            continue
+        try:
+            with os.scandir(entry.path) as it:
+                sub_names = {sub.name for sub in it}
+        except OSError:
+            continue
+        if {'app', 'next.config.js'} <= sub_names:
             # Found Next.js app in subdirectory
-            for backend_check in ['api', 'backend', 'server']:
-                if (project_root / backend_check).exists():
-                    config.project_type = 'monorepo'
-                    config.frontend_root = subdir.name
-                    config.backend_root = backend_check
-                    return config
+            config.project_type = 'monorepo'
+            config.frontend_root = entry.name
+            config.backend_root = backend_dirs[0]
+            return config
     
     # Default to single repo
     config.project_type = 'single'
@@ -7,20 +7,50 @@ Provides consistent data structures across all validators for:
 - Validation report generation
 """
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters use _add_slots
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class Severity(Enum):
-    """Issue severity levels for validation findings."""
+
+def _add_slots(cls: type) -> type:
+    """
+    Rebuild a dataclass with __slots__ if dataclass() did not add them.
+
+    Mirrors dataclass(slots=True) for Python 3.9, where per-instance
+    __dict__ storage would otherwise dominate the size of small records.
+    """
+    if '__slots__' in cls.__dict__:
+        return cls
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items()
+                 if k not in names and k not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+class Severity(str, Enum):
+    """Issue severity levels for validation findings.
+
+    Members are strings, so they serialize as their value without .value.
+    """
     ERROR = "error"
     WARNING = "warning"
     INFO = "info"
 
 
-@dataclass
+# Most severe first. Looking up Severity.ERROR goes through the enum
+# metaclass on every access, so hot paths compare against these instead.
+SEVERITY_ORDER: Tuple[Severity, ...] = tuple(Severity)
+_ERROR, _WARNING = Severity.ERROR, Severity.WARNING
+
+
+@_add_slots
+@dataclass(**_SLOTS)
 class Issue:
     """Represents a single validation issue found in the codebase."""
     file: str
@@ -30,12 +60,43 @@ class Issue:
     message: str
     code_snippet: str = ""
     suggestion: str = ""
+    # Builds code_snippet on first use; reports often render only a few issues
+    snippet_factory: Optional[Callable[[], str]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Rules and suggestions repeat across thousands of issues, and
+        # issues unpickled from worker processes arrive with fresh copies;
+        # share one string per distinct value
+        self.rule = sys.intern(self.rule)
+        self.suggestion = sys.intern(self.suggestion)
+
+    @property
+    def snippet(self) -> str:
+        """Code snippet for the issue, built from snippet_factory if deferred."""
+        if self.snippet_factory is not None:
+            self.code_snippet = self.snippet_factory()
+            self.snippet_factory = None
+        return self.code_snippet
+
+    def __reduce__(self):
+        # Pickle the built snippet, not the factory and the file it holds.
+        # The payload is just the positional field tuple, so an Issue sent
+        # from a worker process is no larger than a bare tuple would be.
+        return (Issue, (self.file, self.line, self.severity, self.rule,
+                        self.message, self.snippet, self.suggestion))
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert issue to dictionary with severity as string."""
+        """Convert issue to dictionary; severity serializes as its string value."""
         return {
-            **asdict(self),
-            "severity": self.severity.value
+            "file": self.file,
+            "line": self.line,
+            "severity": self.severity,
+            "rule": self.rule,
+            "message": self.message,
+            "code_snippet": self.snippet,
+            "suggestion": self.suggestion,
         }
 
 
@@ -52,9 +113,10 @@ class BaseValidationReport:
     def add_issue(self, issue: Issue) -> None:
         """Add an issue and update error/warning counts."""
         self.issues.append(issue)
-        if issue.severity == Severity.ERROR:
+        severity = issue.severity
+        if severity is _ERROR:
             self.errors += 1
-        elif issue.severity == Severity.WARNING:
+        elif severity is _WARNING:
             self.warnings += 1
 
     def finalize(self) -> None:
@@ -6,10 +6,32 @@ across all validators.
 """
 
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby, islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from .models import BaseValidationReport, Issue, Severity
+from .models import SEVERITY_ORDER, BaseValidationReport, Issue, Severity
+
+try:
+    import orjson
+except ImportError:  # Optional; fall back to the standard library
+    orjson = None
+
+_SEVERITY_HEADINGS = {
+    Severity.ERROR: "### ❌ Errors\n\n",
+    Severity.WARNING: "### ⚠️ Warnings\n\n",
+    Severity.INFO: "### ℹ️ Info\n\n",
+}
+
+
+def render_json(report: BaseValidationReport) -> bytes:
+    """Serialize a validation report to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2)
+    return json.dumps(report.to_dict(), indent=2).encode()
 
 
 def output_json(
@@ -29,37 +51,21 @@ def output_json(
         Path to written file
     """
     path = output_dir / filename
-    with open(path, 'w') as f:
-        json.dump(report.to_dict(), f, indent=2)
+    path.write_bytes(render_json(report))
     print(f"JSON report: {path}")
     return path
 
 
-def output_markdown(
+def render_markdown(
     report: BaseValidationReport,
-    output_dir: Path,
-    filename: str,
     title: str,
     custom_sections: Optional[Callable[[BaseValidationReport], str]] = None,
     max_issues: int = 30
-) -> Path:
-    """
-    Write validation report to Markdown file.
-
-    Args:
-        report: Validation report
-        output_dir: Directory to write report
-        filename: Name of output file (e.g., 'error-coverage-report.md')
-        title: Report title
-        custom_sections: Optional function to generate custom report sections
-        max_issues: Maximum number of issues to include
-
-    Returns:
-        Path to written file
-    """
+) -> str:
+    """Render a validation report as Markdown; see output_markdown."""
     status = "✅ PASSED" if report.passed else "❌ FAILED"
 
-    md = f"""# {title}
+    parts = [f"""# {title}
 
 **Generated**: {report.timestamp}
 **Status**: {status}
@@ -72,74 +78,133 @@ def output_markdown(
 | Errors | {report.errors} |
 | Warnings | {report.warnings} |
 
-"""
+"""]
 
     # Add custom sections if provided
     if custom_sections:
-        md += custom_sections(report)
+        parts.append(custom_sections(report))
 
     # Add issues section
     if report.issues:
-        md += "## Issues\n\n"
-
-        # Group by severity
-        errors = [i for i in report.issues if i.severity == Severity.ERROR]
-        warnings = [i for i in report.issues if i.severity == Severity.WARNING]
-        infos = [i for i in report.issues if i.severity == Severity.INFO]
-
-        shown_count = 0
-
-        if errors and shown_count < max_issues:
-            md += "### ❌ Errors\n\n"
-            for issue in errors[:max_issues - shown_count]:
-                md += _format_issue_md(issue)
-                shown_count += 1
-
-        if warnings and shown_count < max_issues:
-            md += "### ⚠️ Warnings\n\n"
-            for issue in warnings[:max_issues - shown_count]:
-                md += _format_issue_md(issue)
-                shown_count += 1
-
-        if infos and shown_count < max_issues:
-            md += "### ℹ️ Info\n\n"
-            for issue in infos[:max_issues - shown_count]:
-                md += _format_issue_md(issue)
-                shown_count += 1
-
-        remaining = len(report.issues) - shown_count
+        parts.append("## Issues\n\n")
+
+        # Group by severity in one pass over report.issues, however they
+        # were added, then take the first max_issues, most severe first
+        by_severity: Dict[Severity, List[Issue]] = {severity: [] for severity in SEVERITY_ORDER}
+        for issue in report.issues:
+            group = by_severity.get(issue.severity)
+            if group is not None:
+                group.append(issue)
+        ordered = chain.from_iterable(by_severity.values())
+        shown = list(islice(ordered, max(max_issues, 0)))
+        for severity, group in groupby(shown, key=attrgetter('severity')):
+            parts.append(_SEVERITY_HEADINGS[severity])
+            for issue in group:
+                _format_issue_md(issue, parts)
+
+        remaining = len(report.issues) - len(shown)
         if remaining > 0:
-            md += f"\n*...and {remaining} more issues*\n"
+            parts.append(f"\n*...and {remaining} more issues*\n")
 
     else:
-        md += "## ✅ No Issues Found\n\nAll checks passed!\n"
+        parts.append("## ✅ No Issues Found\n\nAll checks passed!\n")
+
+    return "".join(parts)
+
+
+def output_markdown(
+    report: BaseValidationReport,
+    output_dir: Path,
+    filename: str,
+    title: str,
+    custom_sections: Optional[Callable[[BaseValidationReport], str]] = None,
+    max_issues: int = 30
+) -> Path:
+    """
+    Write validation report to Markdown file.
+
+    Args:
+        report: Validation report
+        output_dir: Directory to write report
+        filename: Name of output file (e.g., 'error-coverage-report.md')
+        title: Report title
+        custom_sections: Optional function to generate custom report sections
+        max_issues: Maximum number of issues to include
 
+    Returns:
+        Path to written file
+    """
     path = output_dir / filename
-    with open(path, 'w') as f:
-        f.write(md)
+    path.write_bytes(render_markdown(report, title, custom_sections, max_issues).encode())
     print(f"Markdown report: {path}")
     return path
 
 
-def _format_issue_md(issue: Issue) -> str:
-    """Format a single issue as Markdown."""
-    md = f"""#### {issue.rule}
+def output_reports(
+    report: BaseValidationReport,
+    output_dir: Path,
+    json_filename: Optional[str] = None,
+    md_filename: Optional[str] = None,
+    title: str = "",
+    custom_sections: Optional[Callable[[BaseValidationReport], str]] = None
+) -> List[Path]:
+    """
+    Write the JSON and/or Markdown report for a validator run.
+
+    Both documents are rendered first, then written to disk concurrently,
+    so one file's write overlaps the other's. Paths are printed in the
+    same order as output_json followed by output_markdown.
+
+    Args:
+        report: Validation report
+        output_dir: Directory to write reports
+        json_filename: JSON report file name, or None to skip it
+        md_filename: Markdown report file name, or None to skip it
+        title: Markdown report title
+        custom_sections: Optional function to generate custom report sections
+
+    Returns:
+        Paths of written files
+    """
+    writes = []
+    if json_filename:
+        writes.append(("JSON report", output_dir / json_filename, render_json(report)))
+    if md_filename:
+        markdown = render_markdown(report, title, custom_sections)
+        writes.append(("Markdown report", output_dir / md_filename, markdown.encode()))
+
+    if len(writes) > 1:
+        with ThreadPoolExecutor(max_workers=len(writes)) as pool:
+            for future in [pool.submit(path.write_bytes, data) for _, path, data in writes]:
+                future.result()
+    else:
+        for _, path, data in writes:
+            path.write_bytes(data)
+
+    for label, path, _ in writes:
+        print(f"{label}: {path}")
+    return [path for _, path, _ in writes]
+
+
+def _format_issue_md(issue: Issue, parts: List[str]) -> None:
+    """Append a single issue's Markdown to parts."""
+    parts.append(f"""#### {issue.rule}
 **File**: `{issue.file}:{issue.line}`
 
 {issue.message}
 
-"""
-    if issue.code_snippet:
-        md += f"""```typescript
-{issue.code_snippet}
+""")
+    snippet = issue.snippet
+    if snippet:
+        parts.append(f"""```typescript
+{snippet}
 ```
 
-"""
+""")
     if issue.suggestion:
-        md += f"💡 **Suggestion**: {issue.suggestion}\n\n"
+        parts.append(f"💡 **Suggestion**: {issue.suggestion}\n\n")
 
-    md += "---\n\n"
-    return md
+    parts.append("---\n\n")
 
 
 def print_summary_box(
@@ -157,10 +222,13 @@ def print_summary_box(
         passed: Whether validation passed
         width: Box width in characters
     """
-    print("\n" + "=" * width)
-    print(title)
-    print("=" * width)
-    for line in lines:
-        print(line)
-    print(f"Status: {'✅ PASSED' if passed else '❌ FAILED'}")
-    print("=" * width + "\n")
+    rule = "=" * width
+    box = [
+        "\n" + rule,
+        title,
+        rule,
+        *lines,
+        f"Status: {'✅ PASSED' if passed else '❌ FAILED'}",
+        rule + "\n",
+    ]
+    sys.stdout.write("\n".join(box) + "\n")
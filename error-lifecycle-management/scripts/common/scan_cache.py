@@ -0,0 +1,109 @@
+"""
+Persistent per-file scan results for validators.
+
+Repeated runs over a mostly unchanged tree (pre-commit hooks, local
+re-runs) reuse each unchanged file's issues and counts from the previous
+run instead of scanning it again. A file counts as unchanged while its
+size and modification time match the cached entry.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from .models import Issue, Severity
+
+S = TypeVar('S')
+
+# Bump when the on-disk layout changes
+CACHE_FORMAT = 1
+
+
+class ScanCache:
+    """
+    On-disk map of file path to (mtime_ns, size, issues, stats).
+
+    Entries are only valid for the signature they were written under: a
+    digest of the validator's code and the project configuration, so
+    upgrading the scripts or editing .error-lifecycle.json starts afresh.
+    Saving keeps only the files seen in the current run, which bounds the
+    cache by the size of the scanned tree.
+    """
+
+    def __init__(self, path: Path, signature: str, stats_type: Type[S]):
+        self.path = path
+        self.signature = signature
+        self.stats_type = stats_type
+        self._entries: Dict[str, list] = {}
+        self._seen: Dict[str, list] = {}
+
+    @classmethod
+    def load(cls, path: Path, signature: str, stats_type: Type[S]) -> 'ScanCache':
+        """Load the cache at path; a missing, unreadable or stale file loads empty."""
+        cache = cls(path, signature, stats_type)
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return cache
+        if (
+            isinstance(data, dict)
+            and data.get('format') == CACHE_FORMAT
+            and data.get('signature') == signature
+        ):
+            cache._entries = data.get('files', {})
+        return cache
+
+    @staticmethod
+    def file_key(filepath: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, filepath: str, key: Tuple[int, int]) -> Optional[Tuple[List[Issue], S]]:
+        """Return the cached result for an unchanged file, or None."""
+        entry = self._entries.get(filepath)
+        if entry is None or (entry[0], entry[1]) != key:
+            return None
+        try:
+            issues = [
+                Issue(**dict(issue, severity=Severity(issue['severity'])))
+                for issue in entry[2]
+            ]
+            stats = self.stats_type(**entry[3])
+        except (KeyError, TypeError, ValueError):
+            return None
+        self._seen[filepath] = entry
+        return issues, stats
+
+    def put(self, filepath: str, key: Tuple[int, int], result: Tuple[List[Issue], S]) -> None:
+        """Record a freshly scanned file's result."""
+        issues, stats = result
+        self._seen[filepath] = [
+            key[0], key[1], [issue.to_dict() for issue in issues], asdict(stats)
+        ]
+
+    def save(self) -> None:
+        """Write the entries used or added this run; failures are ignored."""
+        data = {'format': CACHE_FORMAT, 'signature': self.signature, 'files': self._seen}
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def cache_signature(*parts: Any) -> str:
+    """Digest the values that scan results depend on into a cache signature."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
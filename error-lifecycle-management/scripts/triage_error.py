@@ -8,31 +8,67 @@ import json
 import sys
 import subprocess
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, Final, List, Any, Mapping, Tuple
+
+SEVERITY_LEVELS: Final[Mapping[str, str]] = {
+    'P0': 'Complete outage or data loss',
+    'P1': 'Critical feature broken, >100 users affected',
+    'P2': 'Important feature degraded, 10-100 users affected',
+    'P3': 'Minor feature issue, <10 users affected',
+    'P4': 'Cosmetic or edge case issue'
+}
+
+RESPONSE_ACTIONS: Final[Mapping[str, Tuple[str, ...]]] = {
+    'P0': (
+        'Page on-call engineer immediately',
+        'Create war room channel',
+        'Update status page',
+        'Begin rollback procedure',
+        'Notify executives'
+    ),
+    'P1': (
+        'Notify on-call engineer',
+        'Create incident channel',
+        'Update status page',
+        'Consider rollback',
+        'Prepare customer communication'
+    ),
+    'P2': (
+        'Create incident ticket',
+        'Notify team via Slack',
+        'Monitor for escalation',
+        'Schedule fix for next deploy'
+    ),
+    'P3': (
+        'Create bug ticket',
+        'Add to sprint backlog',
+        'Monitor error rate'
+    ),
+    'P4': (
+        'Log for future reference',
+        'Consider in next refactor'
+    )
+}
+
+# Title keywords for features whose errors are always P1 or worse
+CRITICAL_TITLE_KEYWORDS: Final[Tuple[str, ...]] = ('payment', 'auth')
 
 class ErrorTriageSystem:
-    def __init__(self):
-        self.severity_levels = {
-            'P0': 'Complete outage or data loss',
-            'P1': 'Critical feature broken, >100 users affected',
-            'P2': 'Important feature degraded, 10-100 users affected',
-            'P3': 'Minor feature issue, <10 users affected',
-            'P4': 'Cosmetic or edge case issue'
-        }
+    severity_levels = SEVERITY_LEVELS
         
     def assess_severity(self, error_data: Dict[str, Any]) -> str:
         """Determine error severity based on impact metrics."""
         user_count = error_data.get('user_count', 0)
         error_rate = error_data.get('error_rate', 0)
-        is_payment = 'payment' in error_data.get('title', '').lower()
-        is_auth = 'auth' in error_data.get('title', '').lower()
+        title = error_data.get('title', '').lower()
+        is_critical_feature = any(keyword in title for keyword in CRITICAL_TITLE_KEYWORDS)
         
         # P0: Complete outage
         if error_rate > 90:
             return 'P0'
         
         # P1: Critical features or many users
-        if is_payment or is_auth or user_count > 100:
+        if is_critical_feature or user_count > 100:
             return 'P1'
         
         # P2: Important features
@@ -48,38 +84,7 @@ class ErrorTriageSystem:
     
     def get_response_actions(self, severity: str) -> List[str]:
         """Get required actions based on severity."""
-        actions = {
-            'P0': [
-                'Page on-call engineer immediately',
-                'Create war room channel',
-                'Update status page',
-                'Begin rollback procedure',
-                'Notify executives'
-            ],
-            'P1': [
-                'Notify on-call engineer',
-                'Create incident channel',
-                'Update status page',
-                'Consider rollback',
-                'Prepare customer communication'
-            ],
-            'P2': [
-                'Create incident ticket',
-                'Notify team via Slack',
-                'Monitor for escalation',
-                'Schedule fix for next deploy'
-            ],
-            'P3': [
-                'Create bug ticket',
-                'Add to sprint backlog',
-                'Monitor error rate'
-            ],
-            'P4': [
-                'Log for future reference',
-                'Consider in next refactor'
-            ]
-        }
-        return actions.get(severity, [])
+        return list(RESPONSE_ACTIONS.get(severity, ()))
     
     def generate_incident_command(self, error_data: Dict[str, Any], severity: str) -> str:
         """Generate incident management commands."""
@@ -135,9 +140,12 @@ vercel rollback --team your-team --project your-project
     
     def triage(self, error_title: str, error_count: int = 1, user_count: int = 0):
         """Main triage function."""
-        print("=" * 60)
-        print("🚨 ERROR TRIAGE SYSTEM")
-        print("=" * 60)
+        # Collect the console report and write it in one call
+        out = [
+            "=" * 60,
+            "🚨 ERROR TRIAGE SYSTEM",
+            "=" * 60,
+        ]
         
         # Simulate getting error data (would come from Sentry API)
         error_data = {
@@ -153,30 +161,35 @@ vercel rollback --team your-team --project your-project
         # Assess severity
         severity = self.assess_severity(error_data)
         
-        print(f"\n📊 ERROR ASSESSMENT")
-        print(f"Title: {error_title}")
-        print(f"Severity: {severity} - {self.severity_levels[severity]}")
-        print(f"Users Affected: {user_count}")
-        print(f"Occurrences: {error_count}")
-        print(f"Error Rate: {error_data['error_rate']:.1f}%")
+        out.extend([
+            f"\n📊 ERROR ASSESSMENT",
+            f"Title: {error_title}",
+            f"Severity: {severity} - {self.severity_levels[severity]}",
+            f"Users Affected: {user_count}",
+            f"Occurrences: {error_count}",
+            f"Error Rate: {error_data['error_rate']:.1f}%",
+        ])
         
         # Get response actions
         actions = self.get_response_actions(severity)
-        print(f"\n✅ REQUIRED ACTIONS:")
+        out.append(f"\n✅ REQUIRED ACTIONS:")
         for i, action in enumerate(actions, 1):
-            print(f"{i}. {action}")
+            out.append(f"{i}. {action}")
         
         # Check recent deployments
         deployments = self.check_recent_deployments()
         if deployments:
-            print(f"\n🔄 RECENT DEPLOYMENTS:")
+            out.append(f"\n🔄 RECENT DEPLOYMENTS:")
             for dep in deployments:
-                print(f"- {dep['created'].strftime('%H:%M')} - {dep['message']} ({dep['commit'][:7]})")
+                out.append(f"- {dep['created'].strftime('%H:%M')} - {dep['message']} ({dep['commit'][:7]})")
         
         # Generate incident commands
         commands = self.generate_incident_command(error_data, severity)
-        print(f"\n💻 COMMANDS TO RUN:")
-        print(commands)
+        out.append(f"\n💻 COMMANDS TO RUN:")
+        out.append(commands)
+        # Written before saving, so the assessment is shown even if the
+        # save fails
+        sys.stdout.write("\n".join(out) + "\n")
         
         # Save triage report
         report = {
@@ -12,6 +12,7 @@ Checks for:
 
 Usage:
     python validate_error_coverage.py [--strict] [--warn] [--json] [--md] [--root /path/to/project]
+        [--concurrency N] [--cache]
 
 Flags:
     --strict    Exit with code 1 if any errors found (default for CI)
@@ -19,6 +20,9 @@ Flags:
     --json      Output JSON report
     --md        Output Markdown report
     --root      Project root directory (default: current directory)
+    --concurrency N
+                Worker processes for scanning (default: CPU count)
+    --cache     Reuse results for files unchanged since the last --cache run
 
 MCP Integration:
     After running this validator, correlate findings with Sentry:
@@ -35,9 +39,9 @@ MCP Integration:
 """
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from common import (
     BaseValidationReport,
@@ -47,8 +51,7 @@ from common import (
     Severity,
     exit_with_status,
     get_output_dir,
-    output_json,
-    output_markdown,
+    output_reports,
     parse_validator_args,
     print_summary_box,
 )
@@ -65,6 +68,12 @@ class Coverage:
     api_calls_with_handling: int = 0
     sentry_captures: int = 0
 
+    def __iadd__(self, other: 'Coverage') -> 'Coverage':
+        """Accumulate another file's counts into this one."""
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        return self
+
     @property
     def async_coverage(self) -> float:
         if self.async_functions == 0:
@@ -113,6 +122,7 @@ class ErrorCoverageValidator(BaseValidator):
         "empty_catch": {
             # Use [ \t]* instead of \s* to avoid matching newlines
             "pattern": r'catch\s*\([^)]*\)\s*\{[ \t]*\}',
+            "literal": "catch",
             "rule": "no-empty-catch",
             "message": "Empty catch block swallows errors silently",
             "severity": Severity.ERROR,
@@ -120,6 +130,7 @@ class ErrorCoverageValidator(BaseValidator):
         },
         "catch_ignore": {
             "pattern": r'catch\s*\(_\)\s*\{',
+            "literal": "catch",
             "rule": "catch-should-use-error",
             "message": "Catch block ignores error parameter",
             "severity": Severity.WARNING,
@@ -127,6 +138,7 @@ class ErrorCoverageValidator(BaseValidator):
         },
         "todo_error": {
             "pattern": r'//\s*TODO.*error|//\s*FIXME.*error',
+            "literal": "//",
             "rule": "unresolved-error-todo",
             "message": "Unresolved TODO/FIXME for error handling",
             "severity": Severity.WARNING,
@@ -134,26 +146,58 @@ class ErrorCoverageValidator(BaseValidator):
         }
     }
 
-    def __init__(self, config: ProjectConfig):
-        super().__init__(config)
-        self.report = ErrorCoverageReport()
-
-    def scan_file(self, filepath: Path) -> List[Issue]:
-        """Scan a single file for error handling issues."""
+    # Compiled once per process rather than looked up in re's cache per file
+    COMPILED_PATTERNS = {
+        name: re.compile(item["pattern"], re.MULTILINE)
+        for name, item in PATTERNS.items()
+    }
+    ASYNC_FUNCTION_PATTERN = re.compile(
+        r'async\s+(?:function\s+)?(\w+)?\s*\([^)]*\)\s*(?::[^{]+)?\s*\{'
+    )
+    SERVER_ACTION_PATTERN = re.compile(r'export\s+async\s+function\s+(\w+)')
+
+    def __init__(
+        self,
+        config: ProjectConfig,
+        run_timestamp: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        super().__init__(config, run_timestamp, max_workers, cache_dir)
+        self.report = ErrorCoverageReport(timestamp=self.run_timestamp)
+        self._api_patterns = [re.compile(p) for p in config.api_patterns]
+
+    def scan_file(self, filepath: str) -> Tuple[List[Issue], Coverage]:
+        """
+        Scan a single file for error handling issues.
+
+        Returns the file's issues and coverage counts without touching
+        self.report, so files can be scanned in worker processes.
+        """
         issues = []
+        coverage = Coverage()
         result = self.read_file_safe(filepath)
         if result is None:
-            return [self.create_read_error_issue(filepath, Exception("Could not read file"))]
+            return [self.create_read_error_issue(filepath, Exception("Could not read file"))], coverage
 
         content, lines = result
         rel_path = self.get_relative_path(filepath)
 
+        # Every pattern starts with a fixed literal; one substring probe per
+        # distinct literal rules out whole groups of patterns before any
+        # regex pass runs
+        present = {
+            literal: literal in content
+            for literal in {item["literal"] for item in self.PATTERNS.values()}
+        }
+
         # Check patterns
         for name, config_item in self.PATTERNS.items():
-            for match in re.finditer(config_item["pattern"], content, re.MULTILINE):
-                line_num = content[:match.start()].count('\n') + 1
-                line_content = lines[line_num - 1] if line_num <= len(lines) else ""
-                if line_content.strip().startswith('//'):
+            if not present[config_item["literal"]]:
+                continue
+            for match in self.COMPILED_PATTERNS[name].finditer(content):
+                line_num = lines.line_of(match.start())
+                if lines.is_comment_line(line_num):
                     continue
                 issues.append(Issue(
                     file=rel_path,
@@ -161,64 +205,53 @@ class ErrorCoverageValidator(BaseValidator):
                     severity=config_item["severity"],
                     rule=config_item["rule"],
                     message=config_item["message"],
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    snippet_factory=self.defer_code_snippet(lines, line_num),
                     suggestion=config_item["suggestion"]
                 ))
 
         # Coverage: async functions
-        for match in re.finditer(r'async\s+(?:function\s+)?(\w+)?\s*\([^)]*\)\s*(?::[^{]+)?\s*\{', content):
-            self.report.coverage.async_functions += 1
+        for match in self.ASYNC_FUNCTION_PATTERN.finditer(content):
+            coverage.async_functions += 1
             func_start = match.end()
-            brace_count, pos = 1, func_start
-            while pos < len(content) and brace_count > 0:
-                if content[pos] == '{':
-                    brace_count += 1
-                elif content[pos] == '}':
-                    brace_count -= 1
-                pos += 1
-            func_body = content[func_start:pos]
+            func_body = content[func_start:lines.block_end(func_start - 1)]
             if 'try' in func_body and 'catch' in func_body:
-                self.report.coverage.async_with_try_catch += 1
+                coverage.async_with_try_catch += 1
 
         # Coverage: server actions
         if "'use server'" in content or '"use server"' in content:
-            for match in re.finditer(r'export\s+async\s+function\s+(\w+)', content):
-                self.report.coverage.server_actions += 1
+            for match in self.SERVER_ACTION_PATTERN.finditer(content):
+                coverage.server_actions += 1
                 func_start = match.end()
                 brace_start = content.find('{', func_start)
                 if brace_start >= 0:
-                    brace_count, pos = 1, brace_start + 1
-                    while pos < len(content) and brace_count > 0:
-                        if content[pos] == '{':
-                            brace_count += 1
-                        elif content[pos] == '}':
-                            brace_count -= 1
-                        pos += 1
-                    func_body = content[brace_start:pos]
+                    func_body = content[brace_start:lines.block_end(brace_start)]
                     if ('try' in func_body and 'catch' in func_body) or 'error:' in func_body:
-                        self.report.coverage.server_actions_with_handling += 1
+                        coverage.server_actions_with_handling += 1
 
         # Coverage: API calls (using configurable patterns)
-        for pattern in self.config.api_patterns:
-            self.report.coverage.api_calls += len(re.findall(pattern, content))
+        for pattern in self._api_patterns:
+            coverage.api_calls += len(pattern.findall(content))
         
-        # Coverage: Sentry captures
-        self.report.coverage.sentry_captures += len(
-            re.findall(r'Sentry\.captureException|captureException', content)
-        )
+        # Coverage: Sentry captures. Every match of
+        # Sentry\.captureException|captureException holds exactly one
+        # "captureException", so a substring count gives the same total.
+        coverage.sentry_captures += content.count('captureException')
 
-        return issues
+        return issues, coverage
 
     def scan_codebase(self) -> None:
         """Scan all configured directories for error handling issues."""
-        scan_dirs = self.get_scan_dirs()
+        files = [
+            filepath
+            for scan_dir in self.get_scan_dirs()
+            for filepath in self.find_files(scan_dir, self.ALL_EXTENSIONS)
+        ]
 
-        for scan_dir in scan_dirs:
-            files = self.find_files(scan_dir, self.ALL_EXTENSIONS)
-            for filepath in files:
-                self.report.total_files_scanned += 1
-                for issue in self.scan_file(filepath):
-                    self.report.add_issue(issue)
+        for issues, coverage in self.scan_files_cached(files, self.scan_file, Coverage):
+            self.report.total_files_scanned += 1
+            for issue in issues:
+                self.report.add_issue(issue)
+            self.report.coverage += coverage
 
         self.report.finalize()
 
@@ -250,20 +283,22 @@ def main():
     args = parse_validator_args("Validate error handling coverage")
     output_dir = get_output_dir(args.project_root)
 
-    validator = ErrorCoverageValidator(args.config)
+    validator = ErrorCoverageValidator(
+        args.config,
+        max_workers=args.concurrency,
+        cache_dir=output_dir / '.cache' if args.cache else None
+    )
     validator.scan_codebase()
     validator.print_summary()
 
-    if args.json_output:
-        output_json(validator.report, output_dir, 'error-coverage-report.json')
-    if args.md_output:
-        output_markdown(
-            validator.report,
-            output_dir,
-            'error-coverage-report.md',
-            'Error Coverage Report',
-            lambda r: validator.get_custom_sections(r)
-        )
+    output_reports(
+        validator.report,
+        output_dir,
+        json_filename='error-coverage-report.json' if args.json_output else None,
+        md_filename='error-coverage-report.md' if args.md_output else None,
+        title='Error Coverage Report',
+        custom_sections=lambda r: validator.get_custom_sections(r)
+    )
 
     exit_with_status(validator.report.passed, args.strict)
 
@@ -10,6 +10,7 @@ Checks for:
 
 Usage:
     python validate_react_query_errors.py [--strict] [--warn] [--json] [--md] [--root /path/to/project]
+        [--concurrency N] [--cache]
 
 MCP Integration:
     1. Get React Query best practices from Context7:
@@ -21,7 +22,7 @@ MCP Integration:
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from common import (
     BaseValidationReport,
@@ -31,13 +32,21 @@ from common import (
     Severity,
     exit_with_status,
     get_output_dir,
-    output_json,
-    output_markdown,
+    output_reports,
     parse_validator_args,
     print_summary_box,
 )
 
 
+@dataclass
+class ReactQueryStats:
+    """React Query call counts for a single file."""
+    mutations_found: int = 0
+    mutations_with_error_handler: int = 0
+    queries_found: int = 0
+    queries_with_error_handling: int = 0
+
+
 @dataclass
 class ReactQueryReport(BaseValidationReport):
     """Extended report with React Query statistics."""
@@ -46,6 +55,13 @@ class ReactQueryReport(BaseValidationReport):
     queries_found: int = 0
     queries_with_error_handling: int = 0
 
+    def add_stats(self, stats: ReactQueryStats) -> None:
+        """Accumulate one file's call counts."""
+        self.mutations_found += stats.mutations_found
+        self.mutations_with_error_handler += stats.mutations_with_error_handler
+        self.queries_found += stats.queries_found
+        self.queries_with_error_handling += stats.queries_with_error_handling
+
     def to_dict(self) -> Dict:
         base = super().to_dict()
         base["mutations_found"] = self.mutations_found
@@ -58,44 +74,58 @@ class ReactQueryReport(BaseValidationReport):
 class ReactQueryValidator(BaseValidator):
     """Validates React Query error handling patterns."""
 
-    def __init__(self, config: ProjectConfig):
-        super().__init__(config)
-        self.report = ReactQueryReport()
-
-    def scan_file(self, filepath: Path) -> List[Issue]:
-        """Scan a single file for React Query issues."""
+    MUTATION_PATTERN = re.compile(r'useMutation\s*\(\s*\{')
+    QUERY_DESTRUCTURE_PATTERN = re.compile(
+        r'(?:const|let)\s*\{\s*([^}]+)\s*\}\s*=\s*useQuery'
+    )
+
+    def __init__(
+        self,
+        config: ProjectConfig,
+        run_timestamp: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        super().__init__(config, run_timestamp, max_workers, cache_dir)
+        self.report = ReactQueryReport(timestamp=self.run_timestamp)
+
+    def scan_file(self, filepath: str) -> Tuple[List[Issue], ReactQueryStats]:
+        """
+        Scan a single file for React Query issues.
+
+        Returns the file's issues and call counts without touching
+        self.report, so files can be scanned in worker processes.
+        """
         issues = []
-        result = self.read_file_safe(filepath)
+        stats = ReactQueryStats()
+        result = self.read_file_safe(filepath, required_any=(b'useMutation', b'useQuery'))
         if result is None:
-            return [self.create_read_error_issue(filepath, Exception("Could not read file"))]
+            return [self.create_read_error_issue(filepath, Exception("Could not read file"))], stats
 
         content, lines = result
         rel_path = self.get_relative_path(filepath)
 
-        # Skip if not using React Query
-        if 'useMutation' not in content and 'useQuery' not in content:
-            return issues
+        # Each pass only runs when its hook is named in the file; two
+        # literal-led passes beat one alternation, which loses re's
+        # literal prefix search
+        has_mutations = 'useMutation' in content
+        has_queries = 'useQuery' in content
+        if not has_mutations and not has_queries:
+            return issues, stats
 
         # Check useMutation calls
-        for match in re.finditer(r'useMutation\s*\(\s*\{', content):
-            self.report.mutations_found += 1
-            line_num = content[:match.start()].count('\n') + 1
+        for match in (self.MUTATION_PATTERN.finditer(content) if has_mutations else ()):
+            stats.mutations_found += 1
+            line_num = lines.line_of(match.start())
 
             # Find the closing brace of the options object
             brace_start = match.end() - 1
-            brace_count, pos = 1, brace_start + 1
-            while pos < len(content) and brace_count > 0:
-                if content[pos] == '{':
-                    brace_count += 1
-                elif content[pos] == '}':
-                    brace_count -= 1
-                pos += 1
-            options_block = content[brace_start:pos]
+            options_block = content[brace_start:lines.block_end(brace_start)]
 
             # Check for onError
             has_on_error = 'onError' in options_block
             if has_on_error:
-                self.report.mutations_with_error_handler += 1
+                stats.mutations_with_error_handler += 1
             else:
                 issues.append(Issue(
                     file=rel_path,
@@ -103,20 +133,20 @@ class ReactQueryValidator(BaseValidator):
                     severity=Severity.WARNING,
                     rule="mutation-needs-onerror",
                     message="useMutation missing onError handler",
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    snippet_factory=self.defer_code_snippet(lines, line_num),
                     suggestion="Add onError: (error) => { /* handle error */ }"
                 ))
 
         # Check useQuery calls for error handling in component
-        for match in re.finditer(r'(?:const|let)\s*\{\s*([^}]+)\s*\}\s*=\s*useQuery', content):
-            self.report.queries_found += 1
-            line_num = content[:match.start()].count('\n') + 1
+        for match in (self.QUERY_DESTRUCTURE_PATTERN.finditer(content) if has_queries else ()):
+            stats.queries_found += 1
+            line_num = lines.line_of(match.start())
             destructured = match.group(1)
 
             # Check if error is destructured
             has_error_destructured = 'error' in destructured or 'isError' in destructured
             if has_error_destructured:
-                self.report.queries_with_error_handling += 1
+                stats.queries_with_error_handling += 1
             else:
                 issues.append(Issue(
                     file=rel_path,
@@ -124,22 +154,25 @@ class ReactQueryValidator(BaseValidator):
                     severity=Severity.INFO,
                     rule="query-should-handle-error",
                     message="useQuery result doesn't destructure error state",
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    snippet_factory=self.defer_code_snippet(lines, line_num),
                     suggestion="Consider destructuring { error, isError } for error handling"
                 ))
 
-        return issues
+        return issues, stats
 
     def scan_codebase(self) -> None:
         """Scan all configured directories for React Query issues."""
-        scan_dirs = self.get_scan_dirs()
+        files = [
+            filepath
+            for scan_dir in self.get_scan_dirs()
+            for filepath in self.find_files(scan_dir, self.ALL_EXTENSIONS)
+        ]
 
-        for scan_dir in scan_dirs:
-            files = self.find_files(scan_dir, self.ALL_EXTENSIONS)
-            for filepath in files:
-                self.report.total_files_scanned += 1
-                for issue in self.scan_file(filepath):
-                    self.report.add_issue(issue)
+        for issues, stats in self.scan_files_cached(files, self.scan_file, ReactQueryStats):
+            self.report.total_files_scanned += 1
+            for issue in issues:
+                self.report.add_issue(issue)
+            self.report.add_stats(stats)
 
         self.report.finalize()
 
@@ -169,20 +202,22 @@ def main():
     args = parse_validator_args("Validate React Query error handling")
     output_dir = get_output_dir(args.project_root)
 
-    validator = ReactQueryValidator(args.config)
+    validator = ReactQueryValidator(
+        args.config,
+        max_workers=args.concurrency,
+        cache_dir=output_dir / '.cache' if args.cache else None
+    )
     validator.scan_codebase()
     validator.print_summary()
 
-    if args.json_output:
-        output_json(validator.report, output_dir, 'react-query-report.json')
-    if args.md_output:
-        output_markdown(
-            validator.report,
-            output_dir,
-            'react-query-report.md',
-            'React Query Validation Report',
-            lambda r: validator.get_custom_sections(r)
-        )
+    output_reports(
+        validator.report,
+        output_dir,
+        json_filename='react-query-report.json' if args.json_output else None,
+        md_filename='react-query-report.md' if args.md_output else None,
+        title='React Query Validation Report',
+        custom_sections=lambda r: validator.get_custom_sections(r)
+    )
 
     exit_with_status(validator.report.passed, args.strict)
 
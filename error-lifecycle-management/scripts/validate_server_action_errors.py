@@ -12,6 +12,7 @@ Checks for:
 
 Usage:
     python validate_server_action_errors.py [--strict] [--warn] [--json] [--md] [--root /path/to/project]
+        [--concurrency N] [--cache]
 
 MCP Integration:
     After running this validator, correlate with production:
@@ -29,7 +30,7 @@ MCP Integration:
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from common import (
     BaseValidationReport,
@@ -39,11 +40,19 @@ from common import (
     Severity,
     exit_with_status,
     get_output_dir,
-    output_json,
-    output_markdown,
+    output_reports,
     parse_validator_args,
     print_summary_box,
 )
+from common.base_validator import SourceLines
+
+
+@dataclass
+class ServerActionStats:
+    """Server action counts for a single file."""
+    server_actions_found: int = 0
+    actions_with_try_catch: int = 0
+    actions_with_sentry: int = 0
 
 
 @dataclass
@@ -53,6 +62,12 @@ class ServerActionReport(BaseValidationReport):
     actions_with_try_catch: int = 0
     actions_with_sentry: int = 0
 
+    def add_stats(self, stats: ServerActionStats) -> None:
+        """Accumulate one file's server action counts."""
+        self.server_actions_found += stats.server_actions_found
+        self.actions_with_try_catch += stats.actions_with_try_catch
+        self.actions_with_sentry += stats.actions_with_sentry
+
     def to_dict(self) -> Dict:
         base = super().to_dict()
         base["server_actions_found"] = self.server_actions_found
@@ -64,49 +79,85 @@ class ServerActionReport(BaseValidationReport):
 class ServerActionValidator(BaseValidator):
     """Validates Next.js Server Action error handling patterns."""
 
-    def __init__(self, config: ProjectConfig):
-        super().__init__(config)
-        self.report = ServerActionReport()
-
-    def scan_file(self, filepath: Path) -> List[Issue]:
-        """Scan a single file for server action issues."""
+    # Files without either directive hold no server actions. Module-level
+    # and inline (function-body) directives both count, so the whole file
+    # is probed rather than just its first bytes.
+    USE_SERVER_DIRECTIVES = (b"'use server'", b'"use server"')
+
+    # Compiled once per process rather than looked up in re's cache per call.
+    # Actions may declare type parameters: export async function f<T>(...)
+    SERVER_ACTION_PATTERN = re.compile(
+        r'export\s+async\s+function\s+(\w+)\s*(?:<[^(]*>)?\s*\([^)]*\)'
+    )
+    RESULT_SUCCESS_PATTERN = re.compile(r'success\s*:')
+    # A newline after 'return' ends the statement, so only spaces may
+    # separate it from the object
+    RETURN_OBJECT_PATTERN = re.compile(r'\breturn[ \t]*\{')
+    # Arrow functions and function expressions nested in an action body;
+    # their returns belong to them, not to the action
+    NESTED_FUNCTION_PATTERN = re.compile(r'=>\s*\{|\bfunction\b[^{;]*\{')
+    # Tokens that matter between a parameter list and the body it opens
+    RETURN_TYPE_TOKEN_PATTERN = re.compile(r'=>|[{<>]')
+    # Text ending in one of these continues a type, so a '{' after it opens
+    # an object type rather than the function body
+    TYPE_CONTINUATIONS = (':', '|', '&', ',', '<', '(', '=>')
+
+    def __init__(
+        self,
+        config: ProjectConfig,
+        run_timestamp: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        super().__init__(config, run_timestamp, max_workers, cache_dir)
+        self.report = ServerActionReport(timestamp=self.run_timestamp)
+
+    def scan_file(self, filepath: str) -> Tuple[List[Issue], ServerActionStats]:
+        """
+        Scan a single file for server action issues.
+
+        Returns the file's issues and action counts without touching
+        self.report, so files can be scanned in worker processes.
+        """
         issues = []
-        result = self.read_file_safe(filepath)
+        stats = ServerActionStats()
+        # Probe the raw bytes for the directive so other files are never
+        # decoded or split into lines
+        result = self.read_file_safe(filepath, required_any=self.USE_SERVER_DIRECTIVES)
         if result is None:
-            return [self.create_read_error_issue(filepath, Exception("Could not read file"))]
+            return [self.create_read_error_issue(filepath, Exception("Could not read file"))], stats
 
         content, lines = result
+        # Directive-only and helper files often export nothing async; every
+        # action match needs the literal 'async', so one substring probe
+        # rules them out before the regex tries each 'export'
+        if 'async' not in content:
+            return issues, stats
         rel_path = self.get_relative_path(filepath)
 
-        # Check if this is a server action file
-        has_use_server = "'use server'" in content or '"use server"' in content
-        if not has_use_server:
-            return issues
-
         # Find all exported async functions (server actions)
-        for match in re.finditer(r'export\s+async\s+function\s+(\w+)\s*\([^)]*\)', content):
+        for match in self.SERVER_ACTION_PATTERN.finditer(content):
             func_name = match.group(1)
-            line_num = content[:match.start()].count('\n') + 1
-            self.report.server_actions_found += 1
+            line_num = lines.line_of(match.start())
+            stats.server_actions_found += 1
 
             # Extract function body
-            func_start = content.find('{', match.end())
+            func_start = self.find_body_start(content, lines, match.end())
             if func_start < 0:
                 continue
 
-            brace_count, pos = 1, func_start + 1
-            while pos < len(content) and brace_count > 0:
-                if content[pos] == '{':
-                    brace_count += 1
-                elif content[pos] == '}':
-                    brace_count -= 1
-                pos += 1
-            func_body = content[func_start:pos]
+            func_end = lines.block_end(func_start)
+            func_body = content[func_start:func_end]
+
+            # The body checks below stay separate substring probes: each is
+            # a C fast search that stops at its first hit, while a single
+            # regex alternation over all tokens loses that search and must
+            # visit every match in the body (measured ~20x slower)
 
             # Check for try/catch
             has_try_catch = 'try' in func_body and 'catch' in func_body
             if has_try_catch:
-                self.report.actions_with_try_catch += 1
+                stats.actions_with_try_catch += 1
             else:
                 issues.append(Issue(
                     file=rel_path,
@@ -114,14 +165,15 @@ class ServerActionValidator(BaseValidator):
                     severity=Severity.ERROR,
                     rule="server-action-needs-try-catch",
                     message=f"Server action '{func_name}' missing try/catch block",
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    snippet_factory=self.defer_code_snippet(lines, line_num),
                     suggestion="Wrap action body in try/catch with error reporting"
                 ))
 
             # Check for Sentry capture in catch blocks
-            has_sentry = 'Sentry.captureException' in func_body or 'captureException' in func_body
+            # Also covers Sentry.captureException
+            has_sentry = 'captureException' in func_body
             if has_sentry:
-                self.report.actions_with_sentry += 1
+                stats.actions_with_sentry += 1
             elif has_try_catch:
                 issues.append(Issue(
                     file=rel_path,
@@ -129,35 +181,93 @@ class ServerActionValidator(BaseValidator):
                     severity=Severity.WARNING,
                     rule="server-action-needs-sentry",
                     message=f"Server action '{func_name}' has try/catch but no Sentry error tracking",
-                    code_snippet=self.get_code_snippet(lines, line_num),
+                    snippet_factory=self.defer_code_snippet(lines, line_num),
                     suggestion="Add Sentry.captureException(error) in catch block"
                 ))
 
             # Check for result type pattern
-            if 'return {' in func_body:
-                if not re.search(r'success\s*:', func_body):
-                    issues.append(Issue(
-                        file=rel_path,
-                        line=line_num,
-                        severity=Severity.WARNING,
-                        rule="server-action-result-type",
-                        message=f"Server action '{func_name}' return may not follow {{ success, error? }} pattern",
-                        code_snippet=self.get_code_snippet(lines, line_num),
-                        suggestion="Return { success: boolean, error?: string, data?: T }"
-                    ))
-
-        return issues
+            if 'return' in func_body and self.has_result_without_success(
+                content, lines, func_start, func_end
+            ):
+                issues.append(Issue(
+                    file=rel_path,
+                    line=line_num,
+                    severity=Severity.WARNING,
+                    rule="server-action-result-type",
+                    message=f"Server action '{func_name}' return may not follow {{ success, error? }} pattern",
+                    snippet_factory=self.defer_code_snippet(lines, line_num),
+                    suggestion="Return { success: boolean, error?: string, data?: T }"
+                ))
+
+        return issues, stats
+
+    def find_body_start(self, content: str, lines: SourceLines, params_end: int) -> int:
+        """
+        Return the offset of the '{' opening a function body, or -1.
+
+        params_end is just past the parameter list. Braces in a return type
+        annotation, such as Promise<{ success: boolean }> or an object type
+        literal, are skipped rather than taken for the body.
+        """
+        depth = 0
+        match = self.RETURN_TYPE_TOKEN_PATTERN.search(content, params_end)
+        while match:
+            token, start = match.group(), match.start()
+            if token == '{':
+                if depth == 0 and not content[params_end:start].rstrip().endswith(
+                    self.TYPE_CONTINUATIONS
+                ):
+                    return start
+                next_pos = lines.block_end(start)
+            else:
+                if token == '<':
+                    depth += 1
+                elif token == '>' and depth:
+                    depth -= 1
+                next_pos = match.end()
+            match = self.RETURN_TYPE_TOKEN_PATTERN.search(content, next_pos)
+        return -1
+
+    def has_result_without_success(
+        self,
+        content: str,
+        lines: SourceLines,
+        body_start: int,
+        body_end: int
+    ) -> bool:
+        """
+        Return whether the action returns an object literal with no success key.
+
+        Only the action's own return statements are checked: returns inside
+        nested arrow functions and function expressions (map callbacks,
+        transaction bodies, ...) produce other values. Each returned object
+        is checked on its own extent rather than across the whole body.
+        """
+        nested = [
+            (match.end() - 1, lines.block_end(match.end() - 1))
+            for match in self.NESTED_FUNCTION_PATTERN.finditer(content, body_start + 1, body_end)
+        ]
+        for match in self.RETURN_OBJECT_PATTERN.finditer(content, body_start, body_end):
+            if any(start < match.start() < end for start, end in nested):
+                continue
+            brace = match.end() - 1
+            if not self.RESULT_SUCCESS_PATTERN.search(content, brace, lines.block_end(brace)):
+                return True
+        return False
 
     def scan_codebase(self) -> None:
         """Scan all configured directories for server action issues."""
-        scan_dirs = self.get_scan_dirs()
+        files = [
+            filepath
+            for scan_dir in self.get_scan_dirs()
+            for filepath in self.find_files(scan_dir, self.TS_EXTENSIONS)
+        ]
 
-        for scan_dir in scan_dirs:
-            files = self.find_files(scan_dir, self.TS_EXTENSIONS)
-            for filepath in files:
-                self.report.total_files_scanned += 1
-                for issue in self.scan_file(filepath):
-                    self.report.add_issue(issue)
+        for issues, stats in self.scan_files_cached(files, self.scan_file, ServerActionStats):
+            self.report.total_files_scanned += 1
+            for issue in issues:
+                self.report.add_issue(issue)
+            self.report.add_stats(stats)
 
         self.report.finalize()
 
@@ -186,20 +296,22 @@ def main():
     args = parse_validator_args("Validate server action error handling")
     output_dir = get_output_dir(args.project_root)
 
-    validator = ServerActionValidator(args.config)
+    validator = ServerActionValidator(
+        args.config,
+        max_workers=args.concurrency,
+        cache_dir=output_dir / '.cache' if args.cache else None
+    )
     validator.scan_codebase()
     validator.print_summary()
 
-    if args.json_output:
-        output_json(validator.report, output_dir, 'server-actions-report.json')
-    if args.md_output:
-        output_markdown(
-            validator.report,
-            output_dir,
-            'server-actions-report.md',
-            'Server Action Validation Report',
-            lambda r: validator.get_custom_sections(r)
-        )
+    output_reports(
+        validator.report,
+        output_dir,
+        json_filename='server-actions-report.json' if args.json_output else None,
+        md_filename='server-actions-report.md' if args.md_output else None,
+        title='Server Action Validation Report',
+        custom_sections=lambda r: validator.get_custom_sections(r)
+    )
 
     exit_with_status(validator.report.passed, args.strict)
 
@@ -7,6 +7,7 @@ and maintains the generalization queue.
 
 Usage:
     python aggregate_patterns.py --refinement REF-ID
+    python aggregate_patterns.py --refinements REF-ID1,REF-ID2,...
     python aggregate_patterns.py --check-all
     python aggregate_patterns.py --list-ready
 
@@ -14,13 +15,14 @@ Usage:
     from aggregate_patterns import PatternAggregator
     aggregator = PatternAggregator()
     pattern = aggregator.process_new_refinement(refinement_data)
+    patterns = aggregator.process_new_refinements([ref1, ref2])
 """
 
 import argparse
 import json
 import re
 import sys
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -42,6 +44,14 @@ GENERALIZATION_THRESHOLD = 2
 # Similarity threshold for pattern matching (0-1)
 SIMILARITY_THRESHOLD = 0.6
 
+# Order of the sections patterns are saved under in aggregated-patterns.md
+SAVED_STATUS_ORDER = [
+    PatternStatus.READY,
+    PatternStatus.TRACKING,
+    PatternStatus.GENERALIZED,
+    PatternStatus.DISMISSED,
+]
+
 
 class PatternAggregator:
     """Track and aggregate refinement patterns across projects."""
@@ -58,6 +68,9 @@ class PatternAggregator:
         self.persistence = RefinementPersistence(self.refinements_dir)
         self.patterns_file = self.refinements_dir / "aggregated-patterns.md"
         self.queue_file = self.refinements_dir / "generalization-queue.md"
+        # Parsed patterns and the (mtime_ns, size) of the file they match
+        self._cached_patterns: Optional[List[Pattern]] = None
+        self._cached_stamp: Optional[Tuple[int, int]] = None
 
     def process_new_refinement(self, refinement: Refinement) -> Optional[Pattern]:
         """
@@ -94,6 +107,61 @@ class PatternAggregator:
 
         return pattern
 
+    def process_new_refinements(self, refinements: List[Refinement]) -> List[Pattern]:
+        """
+        Process several refinements with a single load and save.
+
+        Produces the same patterns and queue as calling
+        process_new_refinement for each in turn, but the patterns file is
+        parsed and rewritten once, and the queue written at most once,
+        instead of once per refinement.
+
+        Args:
+            refinements: The refinements to process, in order.
+
+        Returns:
+            The matched or created pattern for each refinement, as it stood
+            after that refinement was applied.
+        """
+        patterns = self._load_patterns()
+        results = []
+        queue_entries = []
+        # get_pattern_id() reads the saved file, which only changes at the end
+        next_number = None
+
+        for refinement in refinements:
+            matching_pattern = self._find_matching_pattern(refinement, patterns)
+
+            if matching_pattern:
+                index = next(i for i, p in enumerate(patterns) if p is matching_pattern)
+                pattern = self._update_pattern(matching_pattern, refinement)
+            else:
+                if next_number is None:
+                    next_number = int(get_pattern_id().split("-")[1])
+                pattern = self._create_pattern(refinement, f"PATTERN-{next_number:03d}")
+                next_number += 1
+                index = len(patterns)
+                patterns.append(pattern)
+
+            if pattern.count >= GENERALIZATION_THRESHOLD:
+                if pattern.status != PatternStatus.GENERALIZED:
+                    pattern.status = PatternStatus.READY
+                    queue_entries.append((pattern.id, self._format_queue_entry(pattern)))
+
+            results.append(self._copy_patterns([pattern])[0])
+            # Later refinements must match against the patterns as a reload
+            # would see them, just as they do when processed one at a time:
+            # each pattern normalized by the parser, the list grouped by the
+            # section it was saved under
+            patterns[index] = self._round_trip(pattern)
+            patterns.sort(key=lambda p: SAVED_STATUS_ORDER.index(p.status))
+
+        self._save_patterns(patterns)
+        if queue_entries:
+            self._add_entries_to_queue(queue_entries)
+
+        return results
+
     def check_all_patterns(self) -> List[Pattern]:
         """
         Re-check all patterns and update their status.
@@ -244,9 +312,9 @@ class PatternAggregator:
     # Pattern CRUD
     # =========================================================================
 
-    def _create_pattern(self, refinement: Refinement) -> Pattern:
-        """Create a new pattern from a refinement."""
-        pattern_id = get_pattern_id()
+    def _create_pattern(self, refinement: Refinement, pattern_id: Optional[str] = None) -> Pattern:
+        """Create a new pattern from a refinement, with the next free ID by default."""
+        pattern_id = pattern_id or get_pattern_id()
 
         # Generate pattern name from refinement
         name = self._generate_pattern_name(refinement)
@@ -316,12 +384,49 @@ class PatternAggregator:
     # =========================================================================
 
     def _load_patterns(self) -> List[Pattern]:
-        """Load patterns from aggregated-patterns.md."""
-        if not self.patterns_file.exists():
+        """
+        Load patterns from aggregated-patterns.md.
+
+        The file is only re-read and parsed when it has been saved, or its
+        modification time or size has changed, since the last load;
+        otherwise copies of the cached patterns are returned, so callers
+        may still mutate them.
+        """
+        try:
+            stamp = self._file_stamp()
+        except FileNotFoundError:
+            self._cached_patterns = self._cached_stamp = None
             return []
+        if self._cached_patterns is not None and stamp == self._cached_stamp:
+            return self._copy_patterns(self._cached_patterns)
 
+        patterns = self._parse_patterns(self.patterns_file.read_text())
+        self._cached_patterns = self._copy_patterns(patterns)
+        self._cached_stamp = stamp
+        return patterns
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        """Return (mtime_ns, size) of the patterns file."""
+        st = self.patterns_file.stat()
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _copy_patterns(patterns: List[Pattern]) -> List[Pattern]:
+        """Copy patterns deeply enough that mutating a copy leaves the original."""
+        return [
+            replace(
+                p,
+                affected_skills=list(p.affected_skills),
+                refinement_ids=list(p.refinement_ids),
+                projects=list(p.projects),
+                proposed_changes=dict(p.proposed_changes),
+            )
+            for p in patterns
+        ]
+
+    def _parse_patterns(self, content: str) -> List[Pattern]:
+        """Parse pattern blocks from aggregated-patterns.md content."""
         patterns = []
-        content = self.patterns_file.read_text()
 
         # Parse pattern blocks
         pattern_regex = r"### ([⚪🟡✅⛔]) (PATTERN-\d+): (.+?)\n(.+?)(?=### [⚪🟡✅⛔] PATTERN-|\Z)"
@@ -397,6 +502,11 @@ class PatternAggregator:
 
         return patterns
 
+    def _round_trip(self, pattern: Pattern) -> Pattern:
+        """Return a pattern as saving and reloading it would leave it."""
+        parsed = self._parse_patterns("\n".join(self._format_pattern(pattern)))
+        return parsed[0] if parsed else pattern
+
     def _save_patterns(self, patterns: List[Pattern]) -> None:
         """Save patterns to aggregated-patterns.md."""
         ensure_user_refinements_dir()
@@ -468,6 +578,13 @@ class PatternAggregator:
 
         self.patterns_file.write_text("\n".join(lines))
 
+        # Reload what was written rather than caching these objects: parsing
+        # normalizes some fields (descriptions are stripped and end at '**'),
+        # and matching must see patterns exactly as a fresh load would. The
+        # stamp alone can't be trusted here, as a same-size rewrite may land
+        # within the filesystem's mtime resolution.
+        self._cached_patterns = self._cached_stamp = None
+
     def _format_pattern(self, pattern: Pattern) -> List[str]:
         """Format a pattern for markdown output."""
         status_icons = {
@@ -506,6 +623,10 @@ class PatternAggregator:
 
     def _add_to_generalization_queue(self, pattern: Pattern) -> None:
         """Add a pattern to the generalization queue."""
+        self._add_entries_to_queue([(pattern.id, self._format_queue_entry(pattern))])
+
+    def _add_entries_to_queue(self, entries: List[Tuple[str, str]]) -> None:
+        """Add (pattern ID, formatted entry) pairs to the queue in one write."""
         ensure_user_refinements_dir()
 
         # Read existing queue
@@ -514,21 +635,22 @@ class PatternAggregator:
         else:
             content = self._create_queue_header()
 
-        # Check if already in queue
-        if pattern.id in content:
-            return
-
-        # Add to queue
-        entry = self._format_queue_entry(pattern)
+        added = False
+        for pattern_id, entry in entries:
+            # Check if already in queue
+            if pattern_id in content:
+                continue
 
-        # Insert after "## Ready for Review" header
-        if "## Ready for Review" in content:
-            parts = content.split("## Ready for Review", 1)
-            content = parts[0] + "## Ready for Review\n\n" + entry + parts[1].lstrip()
-        else:
-            content += "\n## Ready for Review\n\n" + entry
+            # Insert after "## Ready for Review" header
+            if "## Ready for Review" in content:
+                parts = content.split("## Ready for Review", 1)
+                content = parts[0] + "## Ready for Review\n\n" + entry + parts[1].lstrip()
+            else:
+                content += "\n## Ready for Review\n\n" + entry
+            added = True
 
-        self.queue_file.write_text(content)
+        if added:
+            self.queue_file.write_text(content)
 
     def _remove_from_queue(self, pattern_id: str) -> None:
         """Remove a pattern from the generalization queue."""
@@ -616,6 +738,11 @@ def parse_args() -> argparse.Namespace:
         "--refinement",
         help="Process a specific refinement by ID",
     )
+    parser.add_argument(
+        "--refinements",
+        metavar="ID1,ID2,...",
+        help="Process several refinements by ID, saving patterns once",
+    )
     parser.add_argument(
         "--check-all",
         action="store_true",
@@ -681,6 +808,28 @@ def main() -> int:
                 print(f"Status: {pattern.status.value}")
         return 0
 
+    # Process several refinements in one pass
+    if args.refinements:
+        ids = [ref_id.strip() for ref_id in args.refinements.split(",") if ref_id.strip()]
+        persistence = RefinementPersistence()
+        by_id = {r.id: r for r in persistence.load_refinements()}
+
+        missing = [ref_id for ref_id in ids if ref_id not in by_id]
+        if missing:
+            print(f"Error: Refinement {', '.join(missing)} not found")
+            return 1
+
+        patterns = aggregator.process_new_refinements([by_id[ref_id] for ref_id in ids])
+        if args.json:
+            print(json.dumps([asdict(p) for p in patterns], indent=2, default=str))
+        else:
+            for ref_id, pattern in zip(ids, patterns):
+                print(f"Processed refinement {ref_id}")
+                print(f"Pattern: {pattern.id} ({pattern.name})")
+                print(f"Count: {pattern.count}")
+                print(f"Status: {pattern.status.value}")
+        return 0
+
     # Check all patterns
     if args.check_all:
         ready = aggregator.check_all_patterns()